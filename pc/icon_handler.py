@@ -1,85 +1,264 @@
+import ctypes
+from ctypes import wintypes
 import win32gui
-import win32ui
 import win32con
 import win32api
 import win32process
-from PIL import Image
-import io
+import pywintypes
+import logging
 import struct
+from array import array
+import time
+from functools import lru_cache
+import numpy as np
 import psutil
 
+logger = logging.getLogger(__name__)
+
+# WM_GETICON type that returns the small icon or the system-generated one
+ICON_SMALL2 = 2
+# How long to wait on a window's message loop before treating it as hung
+ICON_QUERY_TIMEOUT_MS = 50
+# How long the PID -> windows index is reused before enumerating again
+WINDOW_INDEX_TTL = 2.0
+
+BI_RGB = 0
+DIB_RGB_COLORS = 0
+
+class BITMAPINFOHEADER(ctypes.Structure):
+    _fields_ = [
+        ('biSize', wintypes.DWORD),
+        ('biWidth', wintypes.LONG),
+        ('biHeight', wintypes.LONG),
+        ('biPlanes', wintypes.WORD),
+        ('biBitCount', wintypes.WORD),
+        ('biCompression', wintypes.DWORD),
+        ('biSizeImage', wintypes.DWORD),
+        ('biXPelsPerMeter', wintypes.LONG),
+        ('biYPelsPerMeter', wintypes.LONG),
+        ('biClrUsed', wintypes.DWORD),
+        ('biClrImportant', wintypes.DWORD),
+    ]
+
+class BITMAPINFO(ctypes.Structure):
+    _fields_ = [
+        ('bmiHeader', BITMAPINFOHEADER),
+        ('bmiColors', wintypes.DWORD * 3),
+    ]
+
+gdi32 = ctypes.windll.gdi32
+gdi32.CreateDIBSection.argtypes = [
+    wintypes.HDC, ctypes.POINTER(BITMAPINFO), wintypes.UINT,
+    ctypes.POINTER(ctypes.c_void_p), wintypes.HANDLE, wintypes.DWORD
+]
+gdi32.CreateDIBSection.restype = wintypes.HBITMAP
+
+# Per-channel RGB565 contributions for every 8-bit value
+_LUT_R = array('H', [(r >> 3) << 11 for r in range(256)])
+_LUT_G = array('H', [(g >> 2) << 5 for g in range(256)])
+_LUT_B = array('H', [b >> 3 for b in range(256)])
+
 def rgb_to_rgb565(r, g, b):
     """Convert RGB888 to RGB565"""
-    r = (r >> 3) & 0x1F
-    g = (g >> 2) & 0x3F
-    b = (b >> 3) & 0x1F
-    return (r << 11) | (g << 5) | b
+    return _LUT_R[r] | _LUT_G[g] | _LUT_B[b]
+
+def rgb_array_to_rgb565(arr):
+    """Convert an (H, W, 3+) uint8 RGB array to big-endian RGB565 bytes"""
+    # Mask and shift while still uint8, widen only the two channels that move
+    # past bit 7, and let the big-endian store do the byte split
+    rgb565 = (((arr[..., 0] & 0xF8).astype(np.uint16) << 8)
+              | ((arr[..., 1] & 0xFC).astype(np.uint16) << 3)
+              | (arr[..., 2] >> 3))
+    return rgb565.astype('>u2').tobytes()
+
+@lru_cache(maxsize=256)
+def _norm_name(name):
+    """Lowercase a process name and strip .exe; memoised, the set of names is small"""
+    return name.lower().replace('.exe', '')
 
 class IconHandler:
     def __init__(self):
         self.icon_cache = {}  # Cache for storing icons
         self.icon_size = (48, 48)  # Changed to 48x48 square icons
+        self.default_icon = None  # Built on first use; identical for every app
+        self.pid_windows = {}  # pid -> [(hwnd, title, is_visible)], see get_window_index
+        self.pid_windows_time = 0
+        self.pid_names = {}  # pid -> normalised process name, pruned with the window index
+        self.name_windows = None  # normalised name -> windows, built from the window index on demand
+        self.gdi = None  # (memdc, hbmp, brush, old_bitmap, bgra) reused for every icon, see _ensure_gdi
         
     def clear_cache(self):
         """Clear the icon cache"""
         self.icon_cache = {}
+        self.pid_windows = {}
+        self.pid_windows_time = 0
+        self.pid_names = {}
+        self.name_windows = None
+        self._release_gdi()
+        
+    def __del__(self):
+        try:
+            self._release_gdi()
+        except Exception:
+            pass
+        
+    def _ensure_gdi(self):
+        """Create the memory DC, bitmap and brush used to render icons, once
+
+        The bitmap is a 32-bit top-down DIB section, so its pixels can be read
+        in place through the returned (H, W, 4) BGRA array view.
+        """
+        if self.gdi is None:
+            width, height = self.icon_size
+            screen_dc = win32gui.GetDC(0)
+            try:
+                memdc = win32gui.CreateCompatibleDC(screen_dc)
+            finally:
+                win32gui.ReleaseDC(0, screen_dc)
+            
+            bmi = BITMAPINFO()
+            bmi.bmiHeader.biSize = ctypes.sizeof(BITMAPINFOHEADER)
+            bmi.bmiHeader.biWidth = width
+            bmi.bmiHeader.biHeight = -height  # Negative height: rows top to bottom
+            bmi.bmiHeader.biPlanes = 1
+            bmi.bmiHeader.biBitCount = 32
+            bmi.bmiHeader.biCompression = BI_RGB
+            bits = ctypes.c_void_p()
+            hbmp = gdi32.CreateDIBSection(memdc, ctypes.byref(bmi), DIB_RGB_COLORS, ctypes.byref(bits), None, 0)
+            if not hbmp:
+                win32gui.DeleteDC(memdc)
+                raise ctypes.WinError()
+            
+            bgra = np.ctypeslib.as_array(
+                (ctypes.c_ubyte * (width * height * 4)).from_address(bits.value)
+            ).reshape(height, width, 4)
+            old_bitmap = win32gui.SelectObject(memdc, hbmp)
+            brush = win32gui.CreateSolidBrush(win32api.RGB(0, 0, 0))
+            self.gdi = (memdc, hbmp, brush, old_bitmap, bgra)
+        memdc, _, brush, _, bgra = self.gdi
+        return memdc, brush, bgra
+        
+    def _release_gdi(self):
+        """Free the shared icon rendering DC, bitmap and brush"""
+        if self.gdi is None:
+            return
+        memdc, hbmp, brush, old_bitmap, _ = self.gdi
+        self.gdi = None
+        win32gui.SelectObject(memdc, old_bitmap)
+        win32gui.DeleteDC(memdc)
+        win32gui.DeleteObject(hbmp)
+        win32gui.DeleteObject(brush)
         
     def get_process_name_without_exe(self, name):
         """Remove .exe from process name for better matching"""
-        return name.lower().replace('.exe', '')
+        return _norm_name(name)
 
-    def find_process_windows(self, process_name):
-        """Find all windows belonging to processes with the given name"""
-        windows = []
-        target_name = self.get_process_name_without_exe(process_name)
+    def query_window_icon(self, hwnd, icon_type):
+        """Send WM_GETICON without blocking on a hung window; returns 0 on failure"""
+        try:
+            _, hicon = win32gui.SendMessageTimeout(
+                hwnd, win32con.WM_GETICON, icon_type, 0,
+                win32con.SMTO_ABORTIFHUNG | win32con.SMTO_BLOCK,
+                ICON_QUERY_TIMEOUT_MS
+            )
+            return hicon
+        except pywintypes.error:
+            return 0
+
+    def get_window_index(self):
+        """Map PID -> titled top-level windows, rebuilt at most every WINDOW_INDEX_TTL"""
+        now = time.monotonic()
+        if self.pid_windows_time and now - self.pid_windows_time < WINDOW_INDEX_TTL:
+            return self.pid_windows
+        
+        pid_windows = {}
         
         def callback(hwnd, _):
-            if win32gui.IsWindow(hwnd) and win32gui.GetWindowText(hwnd):
-                try:
+            if win32gui.IsWindow(hwnd):
+                title = win32gui.GetWindowText(hwnd)
+                if title and not title.startswith("Default IME") and not title.startswith("MSCTFIME"):
                     _, pid = win32process.GetWindowThreadProcessId(hwnd)
-                    process = psutil.Process(pid)
-                    if self.get_process_name_without_exe(process.name()) == target_name:
-                        is_visible = win32gui.IsWindowVisible(hwnd)
-                        title = win32gui.GetWindowText(hwnd)
-                        if title and not title.startswith("Default IME") and not title.startswith("MSCTFIME"):
-                            windows.append((hwnd, title, is_visible))
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    pass
+                    is_visible = win32gui.IsWindowVisible(hwnd)
+                    pid_windows.setdefault(pid, []).append((hwnd, title, is_visible))
             return True
         
         win32gui.EnumWindows(callback, None)
-        return windows
+        self.pid_windows = pid_windows
+        self.pid_windows_time = now
+        self.name_windows = None
+        
+        # Forget names of PIDs that no longer own windows so a reused PID
+        # can't inherit a stale name
+        self.pid_names = {pid: name for pid, name in self.pid_names.items() if pid in pid_windows}
+        return pid_windows
+
+    def get_pid_name(self, pid):
+        """Normalised process name for a PID, cached; empty if it can't be read"""
+        name = self.pid_names.get(pid)
+        if name is None:
+            try:
+                name = self.get_process_name_without_exe(psutil.Process(pid).name())
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                name = ""
+            self.pid_names[pid] = name
+        return name
+
+    def get_name_index(self):
+        """Map normalised process name -> windows, built once per window index"""
+        pid_windows = self.get_window_index()
+        if self.name_windows is None:
+            name_windows = {}
+            for window_pid, entries in pid_windows.items():
+                name = self.get_pid_name(window_pid)
+                if name:
+                    name_windows.setdefault(name, []).extend(entries)
+            self.name_windows = name_windows
+        return self.name_windows
+
+    def find_process_windows(self, process_name, pid=None):
+        """Find all windows belonging to processes with the given name"""
+        pid_windows = self.get_window_index()
+        
+        # The session's own process usually owns the window
+        if pid in pid_windows:
+            return list(pid_windows[pid])
+        
+        # Otherwise match by name, e.g. audio played from a windowless child process
+        target_name = self.get_process_name_without_exe(process_name)
+        return list(self.get_name_index().get(target_name, ()))
 
     def get_icon_for_app(self, process_name, pid):
         """Get icon for an app, using cache if available"""
-        cache_key = f"{process_name}_{pid}"
+        # The icon belongs to the executable, not the PID, so a relaunched
+        # app (or several processes of the same app) share one entry
+        cache_key = self.get_process_name_without_exe(process_name)
         
         # Check cache first
         if cache_key in self.icon_cache:
             return self.icon_cache[cache_key]
             
         # Find all windows for this process
-        windows = self.find_process_windows(process_name)
+        windows = self.find_process_windows(process_name, pid)
         
         # Get icon if we found any windows
         icon_data = None
         if windows:
-            print(f"Found {len(windows)} windows for {process_name}")
+            logger.debug("Found %s windows for %s", len(windows), process_name)
             visible_windows = [w for w in windows if w[2]]  # Get visible windows
             windows_to_try = visible_windows if visible_windows else windows
             
             for hwnd, title, is_visible in windows_to_try:
-                print(f"Trying to get icon for window: {title} (Visible: {is_visible})")
+                logger.debug("Trying to get icon for window: %s (Visible: %s)", title, is_visible)
                 icon_data = self.get_window_icon(hwnd)
                 if icon_data:
-                    print(f"Successfully got icon for {title}")
+                    logger.debug("Successfully got icon for %s", title)
                     break
         else:
-            print(f"No windows found for {process_name}")
+            logger.debug("No windows found for %s", process_name)
         
         # If no icon found, use default
         if not icon_data:
-            print(f"Using default icon for {process_name}")
+            logger.debug("Using default icon for %s", process_name)
             icon_data = self.get_default_icon()
             
         # Cache the icon
@@ -92,154 +271,84 @@ class IconHandler:
         """Get window icon in RGB565 format"""
         try:
             if not win32gui.IsWindow(hwnd):
-                print(f"Invalid window handle: {hwnd}")
+                logger.debug("Invalid window handle: %s", hwnd)
                 return None
             
             window_text = win32gui.GetWindowText(hwnd)
-            print(f"Attempting to get icon for window: {window_text} (handle: {hwnd})")
+            logger.debug("Attempting to get icon for window: %s (handle: %s)", window_text, hwnd)
             
-            # Try to get icon from window class first
-            hicon = win32gui.SendMessage(hwnd, win32con.WM_GETICON, win32con.ICON_BIG, 0)
+            # Ask the window itself first (big icon suits the 48x48 target,
+            # ICON_SMALL2 covers the small and system-generated icons), then
+            # fall back to the class icons, which need no cross-process message
+            hicon = self.query_window_icon(hwnd, win32con.ICON_BIG)
             if not hicon:
-                # Try to get the icon from the window class
-                hicon = win32gui.GetClassLong(hwnd, win32con.GCL_HICON)
+                hicon = self.query_window_icon(hwnd, ICON_SMALL2)
             if not hicon:
-                # Try to get the small icon
-                hicon = win32gui.SendMessage(hwnd, win32con.WM_GETICON, win32con.ICON_SMALL, 0)
+                hicon = win32gui.GetClassLong(hwnd, win32con.GCL_HICON)
             if not hicon:
                 hicon = win32gui.GetClassLong(hwnd, win32con.GCL_HICONSM)
             
             if hicon:
-                print(f"Got icon handle for {window_text}")
+                logger.debug("Got icon handle for %s", window_text)
+                
                 try:
-                    # Get screen DC
-                    screen_dc = win32gui.GetDC(0)
-                    
-                    # Create memory DC
-                    memdc = win32gui.CreateCompatibleDC(screen_dc)
-                    
-                    # Create bitmap
-                    hbmp = win32gui.CreateCompatibleBitmap(screen_dc, self.icon_size[0], self.icon_size[1])
-                    
-                    # Select bitmap into DC
-                    old_bitmap = win32gui.SelectObject(memdc, hbmp)
+                    memdc, brush, bgra = self._ensure_gdi()
                     
                     # Fill background with black (for transparency)
-                    brush = win32gui.CreateSolidBrush(win32api.RGB(0, 0, 0))
                     win32gui.FillRect(memdc, (0, 0, self.icon_size[0], self.icon_size[1]), brush)
                     
                     # Draw the icon
                     win32gui.DrawIconEx(memdc, 0, 0, hicon, self.icon_size[0], self.icon_size[1], 0, None, win32con.DI_NORMAL)
                     
-                    # Get bitmap bits using win32ui
-                    bmp = win32ui.CreateBitmapFromHandle(hbmp)
-                    bmpstr = bmp.GetBitmapBits(True)
-                    
-                    # Convert to PIL Image
-                    img = Image.frombuffer(
-                        'RGBA',
-                        (self.icon_size[0], self.icon_size[1]),
-                        bmpstr,
-                        'raw',
-                        'BGRA',
-                        0,
-                        1
-                    )
-                    
-                    # Debug: Save first image to check format
-                    img.save("debug_icon_rgba.png")
-                    
-                    # Convert to RGB and save for debug
-                    img_rgb = img.convert('RGB')
-                    img_rgb.save("debug_icon_rgb.png")
-                    
-                    # Convert to RGB565
-                    rgb565_data = bytearray(self.icon_size[0] * self.icon_size[1] * 2)  # 2 bytes per pixel
-                    pixels = img_rgb.load()
-                    
-                    # Debug: Print first few pixels
-                    print("First 4 pixels (RGB):")
-                    for y in range(2):
-                        for x in range(2):
-                            r, g, b = pixels[x, y]
-                            print(f"Pixel ({x},{y}): RGB({r},{g},{b})")
+                    # Make sure GDI has finished drawing before reading the DIB
+                    # bits in place; reversing the first three channels of the
+                    # BGRA view gives RGB without copying (alpha is dropped,
+                    # the background was filled black above)
+                    gdi32.GdiFlush()
+                    pixels = bgra[..., 2::-1]
                     
-                    for y in range(self.icon_size[1]):
-                        for x in range(self.icon_size[0]):
-                            r, g, b = pixels[x, y]
-                            # Convert to RGB565
-                            r5 = (r >> 3) & 0x1F  # 5 bits red
-                            g6 = (g >> 2) & 0x3F  # 6 bits green
-                            b5 = (b >> 3) & 0x1F  # 5 bits blue
-                            rgb565 = (r5 << 11) | (g6 << 5) | b5
-                            
-                            # Store in big-endian format (high byte first)
-                            idx = (y * self.icon_size[0] + x) * 2
-                            rgb565_data[idx] = (rgb565 >> 8) & 0xFF  # High byte
-                            rgb565_data[idx + 1] = rgb565 & 0xFF     # Low byte
-                            
-                            # Debug first few pixels
-                            if y == 0 and x < 2:
-                                print(f"Pixel ({x},{y}): RGB({r},{g},{b}) -> RGB565({r5},{g6},{b5}) = 0x{rgb565:04X}")
+                    # Convert to RGB565 (big-endian, high byte first) in one vectorized pass
+                    rgb565_data = rgb_array_to_rgb565(pixels)
                     
-                    # Debug: Print first few bytes of RGB565 data
-                    print("First 8 bytes of RGB565 data:")
-                    print(" ".join(f"{b:02X}" for b in rgb565_data[:8]))
-                    
-                    print(f"Successfully extracted icon for window {window_text}")
-                    
-                    # Clean up resources
-                    win32gui.DeleteObject(brush)
-                    win32gui.DeleteObject(hbmp)
-                    win32gui.SelectObject(memdc, old_bitmap)
-                    win32gui.DeleteDC(memdc)
-                    win32gui.ReleaseDC(0, screen_dc)
-                    win32gui.DestroyIcon(hicon)
+                    logger.debug("Successfully extracted icon for window %s", window_text)
                     
+                    # The icon itself is owned by the window (WM_GETICON / class
+                    # icon), so it must not be destroyed here
                     return rgb565_data
                     
                 except Exception as e:
-                    print(f"Error converting icon to image for {window_text}: {e}")
-                    try:
-                        win32gui.DestroyIcon(hicon)
-                    except:
-                        pass
+                    logger.error("Error converting icon to image for %s: %s", window_text, e)
+                    # Start from fresh GDI objects next time
+                    self._release_gdi()
                     
             else:
-                print(f"No icon found for window {window_text}")
+                logger.debug("No icon found for window %s", window_text)
             
         except Exception as e:
-            print(f"Error getting icon for window {hwnd}: {str(e)}")
+            logger.error("Error getting icon for window %s: %s", hwnd, e)
             return None
             
     def get_default_icon(self):
+        """Get the default icon used when a window icon cannot be retrieved"""
+        if self.default_icon is None:
+            self.default_icon = self._build_default_icon()
+        return self.default_icon
+            
+    def _build_default_icon(self):
         """Generate a default icon when window icon cannot be retrieved"""
         try:
-            # Create a simple default icon (gray square with white border)
-            img = Image.new('RGB', self.icon_size, (128, 128, 128))
-            pixels = img.load()
+            # A gray square with a white border only has two pixel values, so
+            # assemble the big-endian RGB565 rows from them directly
+            width, height = self.icon_size
+            white = struct.pack('>H', rgb_to_rgb565(255, 255, 255))
+            gray = struct.pack('>H', rgb_to_rgb565(128, 128, 128))
+            edge_row = white * width
+            middle_row = white + gray * (width - 2) + white
+            rgb565_data = edge_row + middle_row * (height - 2) + edge_row
             
-            # Add white border
-            for x in range(self.icon_size[0]):
-                pixels[x, 0] = (255, 255, 255)
-                pixels[x, self.icon_size[1]-1] = (255, 255, 255)
-            for y in range(self.icon_size[1]):
-                pixels[0, y] = (255, 255, 255)
-                pixels[self.icon_size[0]-1, y] = (255, 255, 255)
-                
-            # Convert to RGB565
-            rgb565_data = bytearray(self.icon_size[0] * self.icon_size[1] * 2)
-            for y in range(self.icon_size[1]):
-                for x in range(self.icon_size[0]):
-                    r, g, b = pixels[x, y]
-                    rgb565 = rgb_to_rgb565(r, g, b)
-                    idx = (y * self.icon_size[0] + x) * 2
-                    rgb565_data[idx] = (rgb565 >> 8) & 0xFF
-                    rgb565_data[idx + 1] = rgb565 & 0xFF
-                    
-            print("Generated default icon successfully")
+            logger.debug("Generated default icon successfully")
             return rgb565_data
             
         except Exception as e:
-            print(f"Error creating default icon: {str(e)}")
+            logger.error("Error creating default icon: %s", e)
             return None
\ No newline at end of file
@@ -1,17 +1,50 @@
-import psutil
+import ctypes
+from ctypes import wintypes
 from pycaw.pycaw import AudioUtilities, ISimpleAudioVolume, IAudioSessionControl2, IMMDeviceEnumerator, EDataFlow, ERole
 import win32gui
 import win32ui
 import win32con
 import win32process
 from PIL import Image
-import io
 import logging
 import time
+from functools import lru_cache
 import os
 import win32api
 from comtypes import CLSCTX_ALL, CoCreateInstance, CoInitialize, CoUninitialize
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Worker threads used to extract app icons in parallel
+ICON_WORKERS = 8
+
+# Windows seen by the last get_application_info call, used to expire icon renders
+_known_hwnds = set()
+
+# Executable name and GUID inside an audio device string
+_EXE_RE = re.compile(r'\\([^\\]+\.exe)')
+_GUID_RE = re.compile(r'\{[\w-]+\}')
+
+# Characters dropped from app names when building icon file names
+_SANITIZE_RE = re.compile(r'[^0-9A-Za-z]+')
+
+# Seconds a PID -> executable name lookup is trusted before PIDs may be reused
+PID_NAME_TTL = 2.0
+PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+
+_pid_names = {}
+_pid_names_time = 0
+
+kernel32 = ctypes.windll.kernel32
+kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+kernel32.OpenProcess.restype = wintypes.HANDLE
+kernel32.QueryFullProcessImageNameW.argtypes = [
+    wintypes.HANDLE, wintypes.DWORD, wintypes.LPWSTR, ctypes.POINTER(wintypes.DWORD)
+]
+kernel32.QueryFullProcessImageNameW.restype = wintypes.BOOL
+kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+kernel32.CloseHandle.restype = wintypes.BOOL
 
 # Custom filter to exclude COM pointer messages
 class NoPointerFilter(logging.Filter):
@@ -40,19 +73,138 @@ logger.handlers.clear()
 logger.addHandler(console_handler)
 logger.addHandler(file_handler)
 
+@lru_cache(maxsize=256)
 def get_process_name_without_exe(name):
     """Remove .exe from process name for better matching"""
     return name.lower().replace('.exe', '')
 
-def get_window_icon(hwnd):
-    """Get icon for a window handle"""
+def _pid_to_name(pid):
+    """Executable file name of a process (e.g. 'chrome.exe'), or None if it can't be read
+
+    Uses a limited-information handle, which works across privilege levels
+    without building a psutil.Process per window. Results are kept for
+    PID_NAME_TTL seconds.
+    """
+    global _pid_names_time
+    now = time.monotonic()
+    if now - _pid_names_time > PID_NAME_TTL:
+        _pid_names.clear()
+        _pid_names_time = now
+    if pid in _pid_names:
+        return _pid_names[pid]
+    
+    name = None
+    handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if handle:
+        try:
+            buf = ctypes.create_unicode_buffer(32768)
+            size = wintypes.DWORD(len(buf))
+            if kernel32.QueryFullProcessImageNameW(handle, 0, buf, ctypes.byref(size)):
+                name = os.path.basename(buf.value)
+        finally:
+            kernel32.CloseHandle(handle)
+    _pid_names[pid] = name
+    return name
+
+class _IconCtx:
+    """Memory DC, 60x60 bitmap and background brush for one thread's icon renders
+
+    Creating and freeing these per icon cost several GDI calls, and the old
+    code never freed them, leaking handles on every icon. Each icon worker
+    thread gets its own context from _get_icon_ctx, so renders run side by
+    side without a lock. The objects are built on first use and registered
+    in _icon_ctxs so close_icon_ctxs can free every thread's set.
+    """
+    def __init__(self):
+        self.memdc = None
+        self.hbmp = None
+        self.old_bitmap = None
+        self.brush = None
+        self.bmp = None
+
+    def _create(self):
+        hdc = win32gui.GetDC(0)
+        try:
+            self.memdc = win32gui.CreateCompatibleDC(hdc)
+            self.hbmp = win32gui.CreateCompatibleBitmap(hdc, 60, 60)
+        finally:
+            win32gui.ReleaseDC(0, hdc)
+        self.old_bitmap = win32gui.SelectObject(self.memdc, self.hbmp)
+        self.brush = win32gui.CreateSolidBrush(win32api.RGB(255, 255, 255))
+        self.bmp = win32ui.CreateBitmapFromHandle(self.hbmp)
+        with _icon_ctxs_lock:
+            _icon_ctxs.append(self)
+
+    def render(self, hicon):
+        """Draw hicon on white at 60x60 and return the raw BGRA bytes"""
+        if self.memdc is None:
+            self._create()
+        win32gui.FillRect(self.memdc, (0, 0, 60, 60), self.brush)
+        win32gui.DrawIconEx(self.memdc, 0, 0, hicon, 60, 60, 0, None, win32con.DI_NORMAL)
+        return self.bmp.GetBitmapBits(True)
+
+    def close(self):
+        """Free the GDI objects; the next render recreates them"""
+        if self.memdc is None:
+            return
+        win32gui.SelectObject(self.memdc, self.old_bitmap)
+        self.bmp = None
+        win32gui.DeleteObject(self.brush)
+        win32gui.DeleteObject(self.hbmp)
+        win32gui.DeleteDC(self.memdc)
+        self.memdc = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+# Live contexts, so they can be freed once their worker threads are gone;
+# the lock only guards the list, never a render
+_icon_ctxs = []
+_icon_ctxs_lock = threading.Lock()
+_icon_local = threading.local()
+
+def _get_icon_ctx():
+    """Return the calling thread's icon context, making it on first use"""
+    ctx = getattr(_icon_local, 'ctx', None)
+    if ctx is None:
+        ctx = _icon_local.ctx = _IconCtx()
+    return ctx
+
+def close_icon_ctxs():
+    """Free the GDI objects of every thread's icon context"""
+    with _icon_ctxs_lock:
+        ctxs = _icon_ctxs[:]
+        del _icon_ctxs[:]
+    for ctx in ctxs:
+        ctx.close()
+
+@lru_cache(maxsize=256)
+def _icon_bgra_for_hicon(hicon):
+    """Render an icon handle to 60x60 raw BGRA bytes
+
+    Cached on the handle value: class icons are shared by every window of a
+    class, and the same apps come back on every refresh. The cache is cleared
+    by get_application_info when windows close, since handle values can then
+    be reused.
+    """
+    return _get_icon_ctx().render(hicon)
+
+def get_window_icon_raw(hwnd):
+    """Get icon for a window handle; returns (bgra_bytes, width, height) or None
+
+    The pixels stay raw so nothing pays for PNG compression unless it is
+    written out through save_icon_to_file.
+    """
     try:
         if not win32gui.IsWindow(hwnd):
-            logging.warning(f"Invalid window handle: {hwnd}")
+            logger.warning("Invalid window handle: %s", hwnd)
             return None
             
         window_text = win32gui.GetWindowText(hwnd)
-        logging.debug(f"Attempting to get icon for window: {window_text} (handle: {hwnd})")
+        logger.debug("Attempting to get icon for window: %s (handle: %s)", window_text, hwnd)
         
         try:
             # Try to get icon from window class first
@@ -67,64 +219,23 @@ def get_window_icon(hwnd):
                 hicon = win32gui.GetClassLong(hwnd, win32con.GCL_HICONSM)
                 
             if hicon:
-                logging.debug(f"Got icon handle for {window_text}")
+                logger.debug("Got icon handle for %s", window_text)
                 try:
-                    # Get screen DC
-                    hdc = win32gui.GetDC(0)
-                    
-                    # Create memory DC
-                    memdc = win32gui.CreateCompatibleDC(hdc)
-                    
-                    # Create bitmap (increased to 60x60)
-                    hbmp = win32gui.CreateCompatibleBitmap(hdc, 60, 60)
-                    
-                    # Select bitmap into DC
-                    old_bitmap = win32gui.SelectObject(memdc, hbmp)
-                    
-                    # Fill background with white
-                    brush = win32gui.CreateSolidBrush(win32api.RGB(255, 255, 255))
-                    win32gui.FillRect(memdc, (0, 0, 60, 60), brush)
-                    
-                    # Draw the icon (increased to 60x60)
-                    win32gui.DrawIconEx(memdc, 0, 0, hicon, 60, 60, 0, None, win32con.DI_NORMAL)
-                    
-                    # Get bitmap bits using win32ui
-                    bmp = win32ui.CreateBitmapFromHandle(hbmp)
-                    bmpstr = bmp.GetBitmapBits(True)
-                    
-                    # Convert to PIL Image
-                    img = Image.frombuffer(
-                        'RGBA',
-                        (60, 60),  # Updated size
-                        bmpstr,
-                        'raw',
-                        'BGRA',
-                        0,
-                        1
-                    )
-                    
-                    # Convert to PNG bytes
-                    img_byte_arr = io.BytesIO()
-                    img.save(img_byte_arr, format='PNG')
-                    img_byte_arr.seek(0)
-                    logging.info(f"Successfully converted icon to PNG for {window_text}")
-                    return img_byte_arr.getvalue()
+                    icon_bgra = _icon_bgra_for_hicon(hicon)
+                    logger.info("Successfully read icon bitmap for %s", window_text)
+                    return icon_bgra, 60, 60
                     
                 except Exception as e:
-                    logging.error(f"Error converting icon to image for {window_text}: {e}")
-                    try:
-                        win32gui.DestroyIcon(hicon)
-                    except:
-                        pass
+                    logger.error("Error converting icon to image for %s: %s", window_text, e)
                     
             else:
-                logging.debug(f"No icon found for window {window_text}")
+                logger.debug("No icon found for window %s", window_text)
                 
         except Exception as e:
-            logging.debug(f"Error getting window icon: {e}")
+            logger.debug("Error getting window icon: %s", e)
             
     except Exception as e:
-        logging.error(f"Could not get icon for window: {e}")
+        logger.error("Could not get icon for window: %s", e)
     return None
 
 def find_process_windows(process_name):
@@ -134,53 +245,81 @@ def find_process_windows(process_name):
     
     def callback(hwnd, _):
         if win32gui.IsWindow(hwnd) and win32gui.GetWindowText(hwnd):
-            try:
-                _, pid = win32process.GetWindowThreadProcessId(hwnd)
-                process = psutil.Process(pid)
-                if get_process_name_without_exe(process.name()) == target_name:
-                    is_visible = win32gui.IsWindowVisible(hwnd)
-                    title = win32gui.GetWindowText(hwnd)
-                    if title and not title.startswith("Default IME") and not title.startswith("MSCTFIME"):
-                        windows.append((hwnd, title, is_visible))
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
+            _, pid = win32process.GetWindowThreadProcessId(hwnd)
+            name = _pid_to_name(pid)
+            if name and get_process_name_without_exe(name) == target_name:
+                is_visible = win32gui.IsWindowVisible(hwnd)
+                title = win32gui.GetWindowText(hwnd)
+                if title and not title.startswith("Default IME") and not title.startswith("MSCTFIME"):
+                    windows.append((hwnd, title, is_visible))
         return True
     
     win32gui.EnumWindows(callback, None)
     return windows
 
+def enumerate_windows_by_pid():
+    """Enumerate top-level windows once; returns {pid: [(hwnd, title, is_visible), ...]}
+
+    Titleless windows and IME helper windows are skipped, as in
+    find_process_windows.
+    """
+    windows_by_pid = {}
+    
+    def callback(hwnd, _):
+        title = win32gui.GetWindowText(hwnd)
+        if title and not title.startswith("Default IME") and not title.startswith("MSCTFIME"):
+            _, pid = win32process.GetWindowThreadProcessId(hwnd)
+            windows_by_pid.setdefault(pid, []).append((hwnd, title, win32gui.IsWindowVisible(hwnd)))
+        return True
+    
+    win32gui.EnumWindows(callback, None)
+    return windows_by_pid
+
+def find_window_icon(process_name, windows):
+    """Find a window of the process with a usable icon; returns (icon, window_title)
+
+    icon is get_window_icon_raw's (bgra_bytes, width, height), or None.
+    windows is the process's [(hwnd, title, is_visible), ...] list from
+    enumerate_windows_by_pid.
+    """
+    logger.info("\nLooking for windows for %s", process_name)
+    
+    if not windows:
+        logger.debug("No windows found for %s", process_name)
+        return None, None
+    
+    logger.info("Found %s windows for %s", len(windows), process_name)
+    visible_windows = [w for w in windows if w[2]]
+    windows_to_try = visible_windows if visible_windows else windows
+    
+    for hwnd, title, is_visible in windows_to_try:
+        logger.debug("Trying to get icon for window: %s (Visible: %s)", title, is_visible)
+        icon = get_window_icon_raw(hwnd)
+        if icon:
+            logger.info("Successfully got icon for %s", title)
+            return icon, title
+    return None, None
+
 def parse_device_info(device_string):
     """Parse the device string to get readable information"""
     try:
         # Try to extract the device name from the full path
         if '\\' in device_string:
             # Extract the executable name from the path
-            exe_match = re.search(r'\\([^\\]+\.exe)', device_string)
+            exe_match = _EXE_RE.search(device_string)
             if exe_match:
                 exe_name = exe_match.group(1)
             else:
                 exe_name = "Unknown"
             
             # Try to get the audio device GUID
-            guid_match = re.search(r'\{[\w-]+\}', device_string)
+            guid_match = _GUID_RE.search(device_string)
             device_id = guid_match.group(0) if guid_match else "Unknown Device ID"
             
             return f"Audio Device {device_id} - {exe_name}"
         return device_string
     except Exception as e:
-        logging.debug(f"Error parsing device string: {e}")
-        return "Unknown Device"
-
-def get_device_name_from_id(device_id):
-    """Get friendly name of audio device from its ID"""
-    try:
-        devices = AudioUtilities.GetAllDevices()
-        for device in devices:
-            if device.id == device_id:
-                return device.FriendlyName
-        return "Unknown Device"
-    except Exception as e:
-        logging.debug(f"Error getting device name: {e}")
+        logger.debug("Error parsing device string: %s", e)
         return "Unknown Device"
 
 def get_default_devices():
@@ -193,15 +332,23 @@ def get_default_devices():
             IMMDeviceEnumerator._iid_)
         
         try:
+            # One enumeration serves both lookups; failures fall back to "Unknown Device"
+            device_names = {}
+            try:
+                for device in AudioUtilities.GetAllDevices():
+                    device_names[device.id] = device.FriendlyName
+            except Exception as e:
+                logger.debug("Error getting device names: %s", e)
+            
             # Get default audio endpoint (Default Playback Device)
             default_device = device_enumerator.GetDefaultAudioEndpoint(EDataFlow.eRender.value, ERole.eMultimedia.value)
             default_id = default_device.GetId()
-            default_name = get_device_name_from_id(default_id)
+            default_name = device_names.get(default_id, "Unknown Device")
             
             # Get default communications endpoint
             default_comm_device = device_enumerator.GetDefaultAudioEndpoint(EDataFlow.eRender.value, ERole.eCommunications.value)
             default_comm_id = default_comm_device.GetId()
-            default_comm_name = get_device_name_from_id(default_comm_id)
+            default_comm_name = device_names.get(default_comm_id, "Unknown Device")
             
             return {
                 'default': {'id': default_id, 'name': default_name},
@@ -210,7 +357,7 @@ def get_default_devices():
         finally:
             CoUninitialize()  # Clean up COM
     except Exception as e:
-        logging.error(f"Error getting default devices: {e}")
+        logger.error("Error getting default devices: %s", e)
         return None
 
 def get_application_info():
@@ -225,31 +372,32 @@ def get_application_info():
     
     # Get all audio devices
     all_devices = AudioUtilities.GetAllDevices()
-    logging.info("\nAvailable Audio Devices:")
+    logger.info("\nAvailable Audio Devices:")
     for device in all_devices:
         try:
             name = device.FriendlyName
             if name:
-                logging.info(f"  {name}")
+                logger.info("  %s", name)
                 if "Astro MixAmp Pro Game" in name:
                     default_device = name
                 elif "Astro MixAmp Pro Voice" in name:
                     comm_device = name
         except Exception as e:
-            logging.debug(f"Error getting device name: {e}")
+            logger.debug("Error getting device name: %s", e)
             continue
     
     for session in sessions:
         try:
-            if session.Process and session.Process.name():
+            # pycaw's Process is already a psutil.Process; read it once
+            process = session.Process
+            process_name = process.name() if process else None
+            if process_name:
                 volume = session.SimpleAudioVolume
                 vol_level = volume.GetMasterVolume()
                 muted = volume.GetMute()
                 
                 # Get process info
-                process_name = session.Process.name()
-                pid = session.Process.pid
-                process = psutil.Process(pid)
+                pid = process.pid
                 
                 # Get device info
                 try:
@@ -262,42 +410,20 @@ def get_application_info():
                         device_name = comm_device
                     
                 except Exception as e:
-                    logging.debug(f"Error getting device name: {e}")
+                    logger.debug("Error getting device name: %s", e)
                     device_name = "Unknown Device"
                 
-                logging.info(f"\nLooking for windows for {process_name}")
-                logging.info(f"Device Name: {device_name}")
-                
-                # Rest of the existing window and icon handling code...
-                windows = find_process_windows(process_name)
-                
-                # Get icon if we found any windows
-                icon_data = None
-                window_title = None
-                
-                if windows:
-                    logging.info(f"Found {len(windows)} windows for {process_name}")
-                    visible_windows = [w for w in windows if w[2]]
-                    windows_to_try = visible_windows if visible_windows else windows
-                    
-                    for hwnd, title, is_visible in windows_to_try:
-                        logging.debug(f"Trying to get icon for window: {title} (Visible: {is_visible})")
-                        icon_data = get_window_icon(hwnd)
-                        if icon_data:
-                            window_title = title
-                            logging.info(f"Successfully got icon for {title}")
-                            break
-                else:
-                    logging.debug(f"No windows found for {process_name}")
+                logger.info("Device Name: %s", device_name)
                 
                 info = {
                     "name": process_name,
                     "pid": pid,
                     "volume": int(vol_level * 100),
                     "muted": muted,
-                    "icon_data": icon_data,
-                    "has_icon": icon_data is not None,
-                    "window_title": window_title,
+                    "icon_bgra": None,
+                    "icon_size": None,
+                    "has_icon": False,
+                    "window_title": None,
                     "path": process.exe(),
                     "device_name": device_name
                 }
@@ -305,65 +431,108 @@ def get_application_info():
                 app_info.append(info)
                 
         except Exception as e:
-            logging.error(f"Error getting info for session: {e}")
+            logger.error("Error getting info for session: %s", e)
+    
+    # Walk the window list once for all sessions. Audio often plays from a
+    # helper process with no windows of its own (browsers, Electron apps), so
+    # group the windows by process name as find_process_windows does.
+    global _known_hwnds
+    windows_by_name = {}
+    try:
+        windows_by_pid = enumerate_windows_by_pid()
+        
+        # A closed window may have taken its icon with it, and the handle value
+        # can be handed out again, so drop cached renders when any window is gone
+        hwnds = {hwnd for windows in windows_by_pid.values() for hwnd, _, _ in windows}
+        if not _known_hwnds <= hwnds:
+            _icon_bgra_for_hicon.cache_clear()
+        _known_hwnds = hwnds
+        
+        for pid, windows in windows_by_pid.items():
+            name = _pid_to_name(pid)
+            if name:
+                windows_by_name.setdefault(get_process_name_without_exe(name), []).extend(windows)
+    except Exception as e:
+        logger.error("Error enumerating windows: %s", e)
+    
+    # Icon lookups are independent per app and mostly wait on WM_GETICON
+    # round-trips to other processes, so run them side by side; each worker
+    # draws into its own GDI context
+    with ThreadPoolExecutor(max_workers=ICON_WORKERS) as executor:
+        results = executor.map(
+            find_window_icon,
+            [info["name"] for info in app_info],
+            [windows_by_name.get(get_process_name_without_exe(info["name"]), []) for info in app_info])
+        for info, (icon, window_title) in zip(app_info, results):
+            if icon:
+                info["icon_bgra"] = icon[0]
+                info["icon_size"] = icon[1:]
+            info["has_icon"] = icon is not None
+            info["window_title"] = window_title
+    # The workers have exited, so free the contexts they drew with
+    close_icon_ctxs()
     
     return app_info
 
-def save_icon_to_file(icon_data, filename):
-    """Save icon data to a PNG file"""
-    if icon_data:
-        with open(filename, 'wb') as f:
-            f.write(icon_data)
-        logging.info(f"Saved icon to {filename}")
+def save_icon_to_file(icon_bgra, size, filename):
+    """Save raw BGRA icon data to an image file; the format follows the extension
+
+    PNGs are written at zlib level 1: a 60x60 icon barely shrinks at higher
+    levels, and the default level costs several times the CPU.
+    """
+    if icon_bgra:
+        img = Image.frombuffer('RGBA', size, icon_bgra, 'raw', 'BGRA', 0, 1)
+        img.save(filename, compress_level=1)
+        logger.info("Saved icon to %s", filename)
 
 def main():
     """Main function to test Windows audio functionality"""
-    logging.info("Starting Windows audio test")
+    logger.info("Starting Windows audio test")
     
     # Create icons directory if it doesn't exist
     icons_dir = "icons"
     if not os.path.exists(icons_dir):
         os.makedirs(icons_dir)
-        logging.info(f"Created icons directory: {icons_dir}")
+        logger.info("Created icons directory: %s", icons_dir)
     
     try:
         CoInitialize()  # Initialize COM for the main thread
         try:
             app_info = get_application_info()
             
-            logging.info(f"\nFound {len(app_info)} applications with audio sessions:")
+            logger.info("\nFound %s applications with audio sessions:", len(app_info))
             for app in app_info:
-                logging.info(f"\nApplication: {app['name']}")
-                logging.info(f"  PID: {app['pid']}")
-                logging.info(f"  Volume: {app['volume']}%")
-                logging.info(f"  Muted: {app['muted']}")
-                logging.info(f"  Has Icon: {app['has_icon']}")
-                logging.info(f"  Icon Data Size: {len(app['icon_data']) if app['icon_data'] else 0} bytes")
-                logging.info(f"  Window Title: {app['window_title']}")
-                logging.info(f"  Path: {app['path']}")
-                logging.info(f"  Device Name: {app['device_name']}")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("\nApplication: %s", app['name'])
+                    logger.info("  PID: %s", app['pid'])
+                    logger.info("  Volume: %s%%", app['volume'])
+                    logger.info("  Muted: %s", app['muted'])
+                    logger.info("  Has Icon: %s", app['has_icon'])
+                    logger.info("  Icon Data Size: %s bytes", len(app['icon_bgra']) if app['icon_bgra'] else 0)
+                    logger.info("  Window Title: %s", app['window_title'])
+                    logger.info("  Path: %s", app['path'])
+                    logger.info("  Device Name: %s", app['device_name'])
                 
                 # Save icon if available
-                if app['icon_data']:
-                    safe_name = "".join(x for x in app['name'] if x.isalnum())
+                if app['icon_bgra']:
+                    safe_name = _SANITIZE_RE.sub('', app['name'])
                     icon_path = os.path.join(icons_dir, f"{safe_name}_{app['pid']}.png")
                     try:
-                        with open(icon_path, 'wb') as f:
-                            f.write(app['icon_data'])
-                        logging.info(f"Successfully saved icon to: {icon_path}")
+                        save_icon_to_file(app['icon_bgra'], app['icon_size'], icon_path)
                     except Exception as e:
-                        logging.error(f"Failed to save icon for {app['name']}: {e}")
+                        logger.error("Failed to save icon for %s: %s", app['name'], e)
                 else:
-                    logging.warning(f"No icon data available for {app['name']}")
+                    logger.warning("No icon data available for %s", app['name'])
             
-            logging.info("\nIcons have been saved to the 'icons' directory")
+            logger.info("\nIcons have been saved to the 'icons' directory")
         finally:
+            close_icon_ctxs()
             CoUninitialize()  # Clean up COM
             
     except KeyboardInterrupt:
-        logging.info("\nTest stopped by user")
+        logger.info("\nTest stopped by user")
     except Exception as e:
-        logging.error(f"Error in main: {e}")
+        logger.error("Error in main: %s", e)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
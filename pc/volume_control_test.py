@@ -2,8 +2,11 @@ import psutil
 from pycaw.pycaw import AudioUtilities, ISimpleAudioVolume, IAudioSessionControl2
 import logging
 import time
+from functools import lru_cache
 import json
 import sys
+import queue
+import threading
 from comtypes import CLSCTX_ALL, CoCreateInstance, CoInitialize, CoUninitialize
 
 # Configure logging
@@ -13,36 +16,104 @@ console_handler = logging.StreamHandler()
 console_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
 logger.addHandler(console_handler)
 
+# Seconds an enumerated session list is reused before asking Windows again
+SESSION_CACHE_TTL = 2.0
+
+class SessionCache:
+    """Keeps the pycaw session list between calls
+
+    GetAllSessions walks every session through several COM round-trips, which
+    is far too slow to repeat for each Pico command or monitor poll. The
+    sessions' ISimpleAudioVolume interfaces are queried once per refresh and
+    kept for SESSION_CACHE_TTL seconds; volume and mute are read through them
+    live, so state stays current while new or closed apps show up on the next
+    refresh.
+    """
+    def __init__(self, ttl=SESSION_CACHE_TTL):
+        self.ttl = ttl
+        self.sessions = []
+        self.by_name = {}
+        self.master = None
+        self.master_timestamp = 0
+        self.timestamp = 0
+
+    def refresh(self):
+        """Re-enumerate audio sessions"""
+        self.sessions = []
+        self.by_name = {}
+        for session in AudioUtilities.GetAllSessions():
+            try:
+                process = session.Process
+                if process and process.name():
+                    process_name = process.name()
+                    volume = session.SimpleAudioVolume
+                    # One entry per session: a process can own several
+                    self.sessions.append((process.pid, process_name, volume))
+                    # First session wins, matching the old linear scan
+                    name = get_process_name_without_exe(process_name)
+                    self.by_name.setdefault(name, volume)
+            except Exception as e:
+                logger.debug("Skipping session during refresh: %s", e)
+        self.timestamp = time.monotonic()
+
+    def get_sessions(self):
+        """Return [(pid, name, ISimpleAudioVolume)], refreshing once the TTL has passed"""
+        if time.monotonic() - self.timestamp > self.ttl:
+            self.refresh()
+        return self.sessions
+
+    def find(self, process_name):
+        """Return the volume interface of the first session for process_name, or None
+
+        A miss re-enumerates once in case the app started since the last refresh.
+        """
+        target_name = get_process_name_without_exe(process_name)
+        self.get_sessions()
+        volume = self.by_name.get(target_name)
+        if volume is None:
+            self.refresh()
+            volume = self.by_name.get(target_name)
+        return volume
+
+    def master_volume(self):
+        """Return the speakers' volume interface, re-activating it once the TTL has passed
+
+        GetSpeakers resolves the current default output, so re-activating
+        follows the user to a new device such as freshly plugged headphones.
+        """
+        if self.master is None or time.monotonic() - self.master_timestamp > self.ttl:
+            devices = AudioUtilities.GetSpeakers()
+            interface = devices.Activate(ISimpleAudioVolume._iid_, CLSCTX_ALL, None)
+            self.master = interface.QueryInterface(ISimpleAudioVolume)
+            self.master_timestamp = time.monotonic()
+        return self.master
+
+session_cache = SessionCache()
+
+@lru_cache(maxsize=256)
 def get_process_name_without_exe(name):
     """Remove .exe from process name for better matching"""
     return name.lower().replace('.exe', '')
 
 def get_audio_sessions():
     """Get all audio sessions with their current volume levels"""
-    sessions = AudioUtilities.GetAllSessions()
     session_info = []
     
-    for session in sessions:
+    for pid, process_name, volume in session_cache.get_sessions():
         try:
-            if session.Process and session.Process.name():
-                volume = session.SimpleAudioVolume
-                vol_level = volume.GetMasterVolume()
-                muted = volume.GetMute()
-                
-                # Get process info
-                process_name = session.Process.name()
-                pid = session.Process.pid
-                
-                info = {
-                    "name": process_name,
-                    "pid": pid,
-                    "volume": int(vol_level * 100),
-                    "muted": muted
-                }
-                session_info.append(info)
-                logger.info(f"Found session: {process_name} (PID: {pid}) - Volume: {info['volume']}% - Muted: {muted}")
+            vol_level = volume.GetMasterVolume()
+            muted = volume.GetMute()
+            
+            info = {
+                "name": process_name,
+                "pid": pid,
+                "volume": int(vol_level * 100),
+                "muted": muted
+            }
+            session_info.append(info)
+            logger.info("Found session: %s (PID: %s) - Volume: %s%% - Muted: %s", process_name, pid, info['volume'], muted)
         except Exception as e:
-            logger.error(f"Error getting session info: {e}")
+            logger.error("Error getting session info: %s", e)
     
     return session_info
 
@@ -57,72 +128,55 @@ def set_volume(process_name, volume_level):
     try:
         # Handle master volume separately
         if process_name.lower() == "master":
-            devices = AudioUtilities.GetSpeakers()
-            interface = devices.Activate(ISimpleAudioVolume._iid_, CLSCTX_ALL, None)
-            volume = interface.QueryInterface(ISimpleAudioVolume)
+            volume = session_cache.master_volume()
             volume.SetMasterVolume(volume_level / 100, None)
             current_vol = int(volume.GetMasterVolume() * 100)
-            logger.info(f"Set master volume to {current_vol}%")
+            logger.info("Set master volume to %s%%", current_vol)
             return True, current_vol
 
-        target_name = get_process_name_without_exe(process_name)
-        sessions = AudioUtilities.GetAllSessions()
+        volume = session_cache.find(process_name)
+        if volume is None:
+            logger.warning("Process %s not found", process_name)
+            return False, None
         
-        for session in sessions:
-            try:
-                if session.Process and session.Process.name():
-                    current_name = get_process_name_without_exe(session.Process.name())
-                    if current_name == target_name:
-                        volume = session.SimpleAudioVolume
-                        volume.SetMasterVolume(volume_level / 100, None)
-                        current_vol = int(volume.GetMasterVolume() * 100)
-                        logger.info(f"Set volume for {process_name} to {current_vol}%")
-                        return True, current_vol
-            except Exception as e:
-                logger.error(f"Error setting volume for session: {e}")
-                
-        logger.warning(f"Process {process_name} not found")
-        return False, None
+        volume.SetMasterVolume(volume_level / 100, None)
+        current_vol = int(volume.GetMasterVolume() * 100)
+        logger.info("Set volume for %s to %s%%", process_name, current_vol)
+        return True, current_vol
         
     except Exception as e:
-        logger.error(f"Error in set_volume: {e}")
+        logger.error("Error in set_volume: %s", e)
         return False, None
 
 def toggle_mute(process_name):
-    """Toggle mute state for a specific application"""
+    """Toggle mute state for a specific application
+    Args:
+        process_name (str): Name of the process (with or without .exe)
+    Returns:
+        tuple: (success, new_mute_state)
+    """
     try:
         # Handle master volume separately
         if process_name.lower() == "master":
-            devices = AudioUtilities.GetSpeakers()
-            interface = devices.Activate(ISimpleAudioVolume._iid_, CLSCTX_ALL, None)
-            volume = interface.QueryInterface(ISimpleAudioVolume)
+            volume = session_cache.master_volume()
             current_mute = volume.GetMute()
             volume.SetMute(not current_mute, None)
-            logger.info(f"Toggled master mute to {not current_mute}")
-            return True
+            logger.info("Toggled master mute to %s", not current_mute)
+            return True, not current_mute
 
-        target_name = get_process_name_without_exe(process_name)
-        sessions = AudioUtilities.GetAllSessions()
+        volume = session_cache.find(process_name)
+        if volume is None:
+            logger.warning("Process %s not found", process_name)
+            return False, None
         
-        for session in sessions:
-            try:
-                if session.Process and session.Process.name():
-                    current_name = get_process_name_without_exe(session.Process.name())
-                    if current_name == target_name:
-                        volume = session.SimpleAudioVolume
-                        current_mute = volume.GetMute()
-                        volume.SetMute(not current_mute, None)
-                        logger.info(f"Toggled mute for {process_name} to {not current_mute}")
-                        return True
-            except Exception as e:
-                logger.error(f"Error toggling mute for session: {e}")
-                
-        logger.warning(f"Process {process_name} not found")
-        return False
+        current_mute = volume.GetMute()
+        volume.SetMute(not current_mute, None)
+        logger.info("Toggled mute for %s to %s", process_name, not current_mute)
+        return True, not current_mute
         
     except Exception as e:
-        logger.error(f"Error in toggle_mute: {e}")
-        return False
+        logger.error("Error in toggle_mute: %s", e)
+        return False, None
 
 def handle_command(command):
     """Handle incoming commands from Pico"""
@@ -153,21 +207,57 @@ def handle_command(command):
                 logger.error("Invalid toggle_mute command: missing app")
                 return
                 
-            if toggle_mute(app_name):
-                # Get updated mute state
-                sessions = get_audio_sessions()
-                for session in sessions:
-                    if get_process_name_without_exe(session["name"]) == get_process_name_without_exe(app_name):
-                        response = {
-                            "type": "mute_update",
-                            "app": app_name,
-                            "muted": session["muted"]
-                        }
-                        print(json.dumps(response))
-                        break
+            success, muted = toggle_mute(app_name)
+            if success:
+                # Send mute update confirmation
+                response = {
+                    "type": "mute_update",
+                    "app": app_name,
+                    "muted": muted
+                }
+                print(json.dumps(response))
                         
     except Exception as e:
-        logger.error(f"Error handling command: {e}")
+        logger.error("Error handling command: %s", e)
+
+# Lines read from stdin: JSON commands from the Pico, everything else is menu input
+_commands = queue.Queue()
+_answers = queue.Queue()
+
+def _read_stdin():
+    """Sort stdin lines into the command and answer queues; runs on a daemon thread"""
+    for line in sys.stdin:
+        line = line.strip()
+        if line.startswith('{'):
+            try:
+                _commands.put(json.loads(line))
+            except json.JSONDecodeError:
+                logger.error("Invalid JSON command: %s", line)
+        else:
+            _answers.put(line)
+    _answers.put(None)  # stdin closed
+
+def process_commands():
+    """Handle any Pico commands that arrived since the last call"""
+    while True:
+        try:
+            command = _commands.get_nowait()
+        except queue.Empty:
+            return
+        handle_command(command)
+
+def read_input(prompt):
+    """input() replacement that keeps handling Pico commands while it waits"""
+    print(prompt, end='', flush=True)
+    while True:
+        process_commands()
+        try:
+            answer = _answers.get(timeout=0.1)
+        except queue.Empty:
+            continue
+        if answer is None:
+            raise EOFError
+        return answer
 
 def test_volume_control():
     """Interactive test for volume control"""
@@ -182,30 +272,24 @@ def test_volume_control():
         print("4. Monitor volume changes")
         print("5. Exit")
         
+        # Menu input and Pico commands share stdin, so a single reader thread
+        # owns it and the loop below takes lines from its queues
+        threading.Thread(target=_read_stdin, daemon=True).start()
+        
         while True:
             try:
-                # Check for incoming commands from Pico
-                if sys.stdin in select.select([sys.stdin], [], [], 0)[0]:
-                    line = sys.stdin.readline().strip()
-                    if line:
-                        try:
-                            command = json.loads(line)
-                            handle_command(command)
-                        except json.JSONDecodeError:
-                            logger.error(f"Invalid JSON command: {line}")
-                
-                choice = input("\nEnter choice (1-5): ")
+                choice = read_input("\nEnter choice (1-5): ")
                 
                 if choice == "1":
                     sessions = get_audio_sessions()
                     
                 elif choice == "2":
-                    app_name = input("Enter app name (or 'Master' for system volume): ")
-                    volume = int(input("Enter volume (0-100): "))
+                    app_name = read_input("Enter app name (or 'Master' for system volume): ")
+                    volume = int(read_input("Enter volume (0-100): "))
                     set_volume(app_name, volume)
                     
                 elif choice == "3":
-                    app_name = input("Enter app name (or 'Master' for system volume): ")
+                    app_name = read_input("Enter app name (or 'Master' for system volume): ")
                     toggle_mute(app_name)
                     
                 elif choice == "4":
@@ -213,13 +297,14 @@ def test_volume_control():
                     last_volumes = {}
                     try:
                         while True:
+                            process_commands()
                             sessions = get_audio_sessions()
                             current_volumes = {s["name"]: s["volume"] for s in sessions}
                             
                             # Check for changes
                             for name, volume in current_volumes.items():
                                 if name not in last_volumes or last_volumes[name] != volume:
-                                    logger.info(f"Volume changed - {name}: {volume}%")
+                                    logger.info("Volume changed - %s: %s%%", name, volume)
                             
                             last_volumes = current_volumes
                             time.sleep(0.1)
@@ -229,11 +314,13 @@ def test_volume_control():
                 elif choice == "5":
                     break
                     
+            except EOFError:
+                break
             except Exception as e:
-                logger.error(f"Error in main loop: {e}")
+                logger.error("Error in main loop: %s", e)
                 
     except Exception as e:
-        logger.error(f"Error in test_volume_control: {e}")
+        logger.error("Error in test_volume_control: %s", e)
     finally:
         CoUninitialize()  # Clean up COM
 
@@ -242,10 +242,11 @@ class VolumeMonitor:
         
         for session in sessions:
             try:
-                if session.Process and session.Process.name():
+                process = session.Process
+                process_name = process.name() if process else None
+                if process_name:
                     volume = session.SimpleAudioVolume
-                    process_name = session.Process.name()
-                    pid = session.Process.pid
+                    pid = process.pid
                     
                     # Skip if we've already processed this app
                     if process_name in seen_apps:
@@ -4,23 +4,47 @@ import time
 import usb.device
 from usb.device.cdc import CDCInterface
 import binascii
+from micropython import const
+
+_STATUS_LOG_INTERVAL_MS = const(1000)  # How often update() logs CDC status
+_CDC_OPEN_TIMEOUT_MS = const(5000)  # Max wait for the host to open the CDC port
+
+_LOG_BATCH = const(16)  # Buffered lines before writing to flash
+_log_file = None
+_log_buf = []
 
 def log_to_file(msg):
-    """Write log message to file"""
+    """Write log message to file (buffered, see log_flush)"""
+    _log_buf.append(str(msg) + '\n')
+    if len(_log_buf) >= _LOG_BATCH:
+        log_flush()
+
+def log_flush():
+    """Write buffered log messages to file"""
+    global _log_file
     try:
-        with open('pico_serial.log', 'a') as f:
-            f.write(str(msg) + '\n')
+        if _log_file is None:
+            _log_file = open('pico_serial.log', 'a')
+        _log_file.write("".join(_log_buf))
+        _log_file.flush()
     except:
         pass
+    _log_buf.clear()
+
+def log_reset():
+    """Truncate the log file; buffered messages are kept"""
+    global _log_file
+    try:
+        if _log_file is not None:
+            _log_file.close()
+        _log_file = open('pico_serial.log', 'w')
+    except:
+        _log_file = None
 
 class AppVolumeController:
     def __init__(self):
         # Clear log file on startup
-        try:
-            with open('pico_serial.log', 'w') as f:
-                f.write("")
-        except:
-            pass
+        log_reset()
             
         log_to_file("Initializing AppVolumeController")
         
@@ -41,13 +65,13 @@ class AppVolumeController:
             log_to_file("USB CDC interface initialized")
             
             # Wait for USB host to configure the interface
-            timeout = 50  # 5 seconds timeout
-            while not self.cdc.is_open() and timeout > 0:
-                time.sleep_ms(100)
-                timeout -= 1
-                log_to_file(f"Waiting for CDC interface... ({timeout})")
+            start = time.ticks_ms()
+            while not self.cdc.is_open():
+                if time.ticks_diff(time.ticks_ms(), start) >= _CDC_OPEN_TIMEOUT_MS:
+                    break
+                time.sleep_ms(5)
                 
-            if timeout <= 0:
+            if not self.cdc.is_open():
                 log_to_file("Timeout waiting for CDC interface to be opened")
                 raise Exception("CDC interface timeout")
                 
@@ -55,11 +79,12 @@ class AppVolumeController:
             
         except Exception as e:
             log_to_file(f"Error during CDC setup: {str(e)}")
+            log_flush()
             raise
             
         self.apps = {}
         self.connected = False
-        self.update_count = 0
+        self.next_status_log = time.ticks_add(time.ticks_ms(), _STATUS_LOG_INTERVAL_MS)
         self.input_buffer = bytearray()
         self.receiving_icon = False
         self.current_icon_data = bytearray()
@@ -100,6 +125,7 @@ class AppVolumeController:
                                 log_to_file(f"Stored icon for {self.current_icon_app} ({len(clean_data)} bytes)")
                             except Exception as e:
                                 log_to_file(f"Error storing icon: {str(e)}")
+                                log_flush()
                         # Reset icon receiving state
                         self.receiving_icon = False
                         self.current_icon_data = bytearray()
@@ -124,15 +150,17 @@ class AppVolumeController:
                                 # Split by newlines in case multiple messages got combined
                                 lines = line.split('\n')
                                 for single_line in lines:
-                                    if single_line.strip():
+                                    single_line = single_line.strip()
+                                    if single_line:
                                         try:
                                             # Validate it's proper JSON
-                                            json.loads(single_line.strip())
-                                            log_to_file(f"Found valid JSON before icon: {single_line.strip()}")
+                                            message = json.loads(single_line)
+                                            log_to_file(f"Found valid JSON before icon: {single_line}")
                                             # Process this message immediately
-                                            self.handle_message(json.loads(single_line.strip()))
+                                            self.handle_message(message)
                                         except Exception as e:
-                                            log_to_file(f"Invalid JSON before icon: {single_line.strip()} - {str(e)}")
+                                            log_to_file(f"Invalid JSON before icon: {single_line} - {str(e)}")
+                                            log_flush()
                         except:
                             pass
                     
@@ -159,10 +187,12 @@ class AppVolumeController:
                                 return line
                             except Exception as e:
                                 log_to_file(f"Invalid JSON: {line} - {str(e)}")
+                                log_flush()
                     except ValueError:
                         break
                     except Exception as e:
                         log_to_file(f"Error processing line: {str(e)}")
+                        log_flush()
                         break
                 
                 # Check buffer size
@@ -172,6 +202,7 @@ class AppVolumeController:
                     
         except Exception as e:
             log_to_file(f"Error reading line: {str(e)}")
+            log_flush()
             self.input_buffer = bytearray()  # Clear buffer on error
             self.receiving_icon = False
             self.current_icon_data = bytearray()
@@ -194,6 +225,7 @@ class AppVolumeController:
                 return False
         except Exception as e:
             log_to_file(f"Send error: {str(e)}")
+            log_flush()
             return False
             
     def handle_message(self, data):
@@ -224,6 +256,7 @@ class AppVolumeController:
                     log_to_file(f"Initial config received: {old_count} -> {len(self.apps)} apps")
                 except Exception as e:
                     log_to_file(f"Error processing initial config: {str(e)}")
+                    log_flush()
                 
             elif msg_type == "icon_data":
                 app_name = data.get("app")
@@ -278,17 +311,20 @@ class AppVolumeController:
                     log_to_file(f"Apps with icons: {apps_with_icons}/{len(self.apps)}")
                 except Exception as e:
                     log_to_file(f"Error processing app changes: {str(e)}")
+                    log_flush()
                 
         except Exception as e:
             log_to_file(f"Handle message error: {str(e)}")
+            log_flush()
     
     def update(self):
         try:
             # Check CDC status periodically
-            self.update_count += 1
-            if self.update_count % 100 == 0:
+            now = time.ticks_ms()
+            if time.ticks_diff(now, self.next_status_log) >= 0:
                 is_open = self.cdc.is_open()
                 log_to_file(f"Status - CDC open: {is_open}, Connected: {self.connected}, Apps: {len(self.apps)}")
+                self.next_status_log = time.ticks_add(now, _STATUS_LOG_INTERVAL_MS)
                 
             # Read and process any available messages
             line = self.read_line()
@@ -298,8 +334,10 @@ class AppVolumeController:
                     self.handle_message(data)
                 except Exception as e:
                     log_to_file(f"Error processing message: {str(e)}")
+                    log_flush()
                     
         except Exception as e:
             log_to_file(f"Update error: {str(e)}")
+            log_flush()
             
         time.sleep(0.01)  # Small delay to prevent tight loop 
\ No newline at end of file
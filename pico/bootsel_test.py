@@ -11,19 +11,27 @@ print(f"Initial state: {'Pressed' if last_state else 'Released'}")
 
 debounce_time = 50  # 50ms debounce
 last_change = time.ticks_ms()
+last_debug_print = last_change
+
+# Local aliases skip the module attribute lookups in the poll loop
+bootsel_button = rp2.bootsel_button
+ticks_ms = time.ticks_ms
+ticks_diff = time.ticks_diff
+sleep_ms = time.sleep_ms
 
 while True:
-    current_state = rp2.bootsel_button()
-    current_time = time.ticks_ms()
+    current_state = bootsel_button()
+    current_time = ticks_ms()
     
     # Only process state changes after debounce period
-    if current_state != last_state and time.ticks_diff(current_time, last_change) > debounce_time:
+    if current_state != last_state and ticks_diff(current_time, last_change) > debounce_time:
         print(f"BOOTSEL button {'pressed' if current_state else 'released'}")
         last_state = current_state
         last_change = current_time
     
     # Print debug info every 2 seconds
-    if time.ticks_ms() % 2000 < 100:
+    if ticks_diff(current_time, last_debug_print) >= 2000:
         print(f"Debug - Current state: {'Pressed' if current_state else 'Released'}")
+        last_debug_print = current_time
     
-    time.sleep_ms(10) 
\ No newline at end of file
+    sleep_ms(20) 
\ No newline at end of file
@@ -1,3 +1,4 @@
+import micropython
 from micropython import const
 import time
 from machine import Pin, SPI
@@ -14,11 +15,80 @@ _MADCTL = const(0x36)
 _COLMOD = const(0x3A)
 _PIXFMT = const(0x3A)
 
-def color565(r, g, b):
+@micropython.viper
+def color565(r: int, g: int, b: int) -> int:
     """Convert RGB888 to RGB565 format"""
     return ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
 
+@micropython.viper
+def _repeat_pattern(buf: ptr8, n: int, size: int):
+    """Repeat the first size bytes of buf across its first n bytes"""
+    i = size
+    while i < n:
+        buf[i] = buf[i - size]
+        i += 1
+
+def _rgb666(color):
+    """Return the 3-byte RGB666 pixel for an RGB565 int or an [r, g, b] list
+
+    The panel runs in 18-bit mode (COLMOD 0x66): on a 4-wire SPI bus the
+    ILI9488 does not accept 16-bit pixels.
+    """
+    if isinstance(color, list):
+        return bytes(color)
+    return bytes((((color >> 11) & 0x1F) << 1,  # 5 bits to 6 bits
+                  (color >> 5) & 0x3F,          # 6 bits to 6 bits
+                  (color & 0x1F) << 1))         # 5 bits to 6 bits
+
+# Rendered glyphs keyed by (char code, colour bytes, background bytes, scale);
+# the UI reuses a handful of colour pairs, so most characters hit this cache.
+# The cap is in bytes rather than entries: a glyph is 192 bytes at scale 1 but
+# grows with scale squared (1728 bytes at scale 3), which an entry count
+# would let eat most of the RP2040's RAM.
+_GLYPH_CACHE_BYTES = const(16384)
+_glyph_cache = {}
+_glyph_cache_size = 0
+# MicroPython dicts don't keep insertion order, so the order glyphs were
+# cached in is tracked here and the oldest is evicted first
+_glyph_order = []
+
+def _cache_glyph(key, glyph):
+    """Store a rendered glyph, evicting entries to stay within _GLYPH_CACHE_BYTES"""
+    global _glyph_cache_size
+    size = len(glyph)
+    if size > _GLYPH_CACHE_BYTES:
+        return
+    while _glyph_cache_size + size > _GLYPH_CACHE_BYTES:
+        _glyph_cache_size -= len(_glyph_cache.pop(_glyph_order.pop(0)))
+    _glyph_cache[key] = glyph
+    _glyph_order.append(key)
+    _glyph_cache_size += size
+
+def _render_glyph(pattern, color_bytes, bg_bytes, scale):
+    """Expand an 8x8 font pattern into an RGB666 bitmap"""
+    row_len = 24 * scale  # 8 pixels * 3 bytes * scale
+    glyph = bytearray(row_len * 8 * scale)
+    offset = 0
+    for row in range(8):
+        bits = pattern[row]
+        row_start = offset
+        for col in range(8):
+            pixel_bytes = color_bytes if bits & (0x80 >> col) else bg_bytes
+            # Scale horizontally by duplicating pixels
+            for sx in range(scale):
+                glyph[offset:offset + 3] = pixel_bytes
+                offset += 3
+        # Repeat the row to scale vertically
+        for sy in range(1, scale):
+            glyph[offset:offset + row_len] = glyph[row_start:row_start + row_len]
+            offset += row_len
+    return glyph
+
 class ILI9488:
+    # Set to True to trace fills and blits; off by default because the
+    # console write costs more than the SPI transfer it describes
+    DEBUG = False
+    
     def __init__(self, spi, dc, cs, rst, width=480, height=320):
         self.spi = spi
         self.dc = dc
@@ -35,6 +105,17 @@ class ILI9488:
         
         # No need to reinitialize SPI as it's already set up
         
+        # Flood buffer for fill_rect, allocated once: two display rows of
+        # 3-byte pixels, refilled only when the fill colour changes
+        self._fill_buf = bytearray(width * 2 * 3)
+        self._fill_mv = memoryview(self._fill_buf)
+        self._fill_color = None
+        
+        # Scratch buffers for command bytes and window coordinates so the
+        # drawing paths don't allocate per call
+        self._cmd_buf = bytearray(1)
+        self._win_buf = bytearray(4)
+        
         self.reset()
         self.init()
         
@@ -56,75 +137,59 @@ class ILI9488:
         time.sleep_ms(100)
         
         # Basic initialization
-        self._write_cmd(_SWRESET)    # Software reset
+        self._write(_SWRESET)    # Software reset
         time.sleep_ms(100)
         
-        self._write_cmd(_SLPOUT)     # Sleep out
+        self._write(_SLPOUT)     # Sleep out
         time.sleep_ms(100)
         
         # Gamma settings
-        self._write_cmd(0xE0)    # Positive Gamma Control
-        self._write_data(bytearray([0x00, 0x03, 0x09, 0x08, 0x16, 0x0A, 0x3F, 0x78,
-                                  0x4C, 0x09, 0x0A, 0x08, 0x16, 0x1A, 0x0F]))
-
-        self._write_cmd(0xE1)    # Negative Gamma Control
-        self._write_data(bytearray([0x00, 0x16, 0x19, 0x03, 0x0F, 0x05, 0x32, 0x45,
-                                  0x46, 0x04, 0x0E, 0x0D, 0x35, 0x37, 0x0F]))
-
-        self._write_cmd(0xC0)    # Power Control 1
-        self._write_data(bytearray([0x17, 0x15]))
+        # Positive Gamma Control
+        self._write(0xE0, bytearray([0x00, 0x03, 0x09, 0x08, 0x16, 0x0A, 0x3F, 0x78,
+                                     0x4C, 0x09, 0x0A, 0x08, 0x16, 0x1A, 0x0F]))
 
-        self._write_cmd(0xC1)    # Power Control 2
-        self._write_data(bytearray([0x41]))
+        # Negative Gamma Control
+        self._write(0xE1, bytearray([0x00, 0x16, 0x19, 0x03, 0x0F, 0x05, 0x32, 0x45,
+                                     0x46, 0x04, 0x0E, 0x0D, 0x35, 0x37, 0x0F]))
 
-        self._write_cmd(0xC5)    # VCOM Control
-        self._write_data(bytearray([0x00, 0x12, 0x80]))
+        self._write(0xC0, bytearray([0x17, 0x15]))          # Power Control 1
+        self._write(0xC1, bytearray([0x41]))                # Power Control 2
+        self._write(0xC5, bytearray([0x00, 0x12, 0x80]))    # VCOM Control
 
         # Memory Access Control
-        self._write_cmd(_MADCTL)
-        self._write_data(bytearray([0xE8]))  # MY=1, MX=1, MV=1, BGR=1
+        self._write(_MADCTL, bytearray([0xE8]))  # MY=1, MX=1, MV=1, BGR=1
 
         # Interface Pixel Format
-        self._write_cmd(_PIXFMT)
-        self._write_data(bytearray([0x66]))  # 18-bit color format
+        self._write(_PIXFMT, bytearray([0x66]))  # 18-bit color format
 
         # Frame Rate Control
-        self._write_cmd(0xB1)
-        self._write_data(bytearray([0x00, 0x18]))
+        self._write(0xB1, bytearray([0x00, 0x18]))
 
         # Display Function Control
-        self._write_cmd(0xB6)
-        self._write_data(bytearray([0x02, 0x02]))
+        self._write(0xB6, bytearray([0x02, 0x02]))
 
         # Interface Control
-        self._write_cmd(0xF6)
-        self._write_data(bytearray([0x01, 0x30, 0x00]))
+        self._write(0xF6, bytearray([0x01, 0x30, 0x00]))
 
         # Enable 3G
-        self._write_cmd(0xF2)
-        self._write_data(bytearray([0x00]))
+        self._write(0xF2, bytearray([0x00]))
 
         # Gamma Set
-        self._write_cmd(0x26)
-        self._write_data(bytearray([0x01]))
+        self._write(0x26, bytearray([0x01]))
 
         # Display ON
-        self._write_cmd(_DISPON)
+        self._write(_DISPON)
         time.sleep_ms(100)
         
         print("Display initialization complete")
         
     def fill(self, color):
         """Fill the entire screen with a color"""
-        print(f"Attempting to fill with color: 0x{color:04X}")
-        
-        # Convert 16-bit RGB565 to 18-bit RGB666
-        r = ((color >> 11) & 0x1F) << 1  # 5 bits to 6 bits
-        g = ((color >> 5) & 0x3F)        # 6 bits to 6 bits
-        b = (color & 0x1F) << 1          # 5 bits to 6 bits
+        if self.DEBUG:
+            print(f"Attempting to fill with color: 0x{color:04X}")
         
         # Fill the entire screen using fill_rect
-        self.fill_rect(0, 0, self.width, self.height, [r, g, b])
+        self.fill_rect(0, 0, self.width, self.height, color)
         
     def fill_rect(self, x, y, w, h, color):
         """Fill a rectangle area with a color"""
@@ -134,56 +199,30 @@ class ILI9488:
         w = min(w, self.width - x)
         h = min(h, self.height - y)
         
-        # Set column address
-        self._write_cmd(0x2A)
-        self._write_data(bytearray([x >> 8, x & 0xFF, (x + w - 1) >> 8, (x + w - 1) & 0xFF]))
-        
-        # Set row address
-        self._write_cmd(0x2B)
-        self._write_data(bytearray([y >> 8, y & 0xFF, (y + h - 1) >> 8, (y + h - 1) & 0xFF]))
+        if w <= 0 or h <= 0:
+            return
         
-        # Write to RAM
-        self._write_cmd(0x2C)
+        # Open the window; CS stays low for the pixel flood below
+        self._set_window(x, y, x + w - 1, y + h - 1)
         
-        # If color is a list, it's RGB values for 18-bit color
-        if isinstance(color, list):
-            r, g, b = color
-            color_bytes = bytearray([r, g, b])
-        else:
-            # Convert 16-bit color to 18-bit
-            r = ((color >> 11) & 0x1F) << 1
-            g = ((color >> 5) & 0x3F)
-            b = (color & 0x1F) << 1
-            color_bytes = bytearray([r, g, b])
-        
-        # Create a larger buffer (about full screen width)
-        pixels_per_write = min(w * h, self.width * 2)  # Use larger chunks
-        buffer = bytearray(pixels_per_write * 3)  # 3 bytes per pixel
-        
-        # Fill buffer with color pattern - optimize by copying in chunks
-        chunk = bytearray([color_bytes[0], color_bytes[1], color_bytes[2]] * 16)  # Create a small chunk
-        chunk_size = len(chunk)
-        
-        # Fill the buffer by copying the chunk repeatedly
-        for i in range(0, len(buffer), chunk_size):
-            remaining = len(buffer) - i
-            if remaining >= chunk_size:
-                buffer[i:i + chunk_size] = chunk
-            else:
-                buffer[i:i + remaining] = chunk[:remaining]
-        
-        # Fill rectangle
-        self.cs.value(0)
-        self.dc.value(1)
+        buf = self._fill_buf
+        mv = self._fill_mv
+        buf_len = len(buf)
         
-        # Write in larger chunks
-        total_pixels = w * h
-        remaining_pixels = total_pixels
+        # Convert and repaint the flood buffer only when the colour changes;
+        # list colours are copied so a caller reusing its list can't leave
+        # a stale buffer behind
+        if color != self._fill_color:
+            buf[0:3] = _rgb666(color)
+            _repeat_pattern(buf, buf_len, 3)
+            self._fill_color = list(color) if isinstance(color, list) else color
         
-        while remaining_pixels > 0:
-            write_pixels = min(pixels_per_write, remaining_pixels)
-            self.spi.write(buffer[:write_pixels * 3])
-            remaining_pixels -= write_pixels
+        # Stream the rectangle in buffer-sized writes without copying slices
+        remaining = w * h * 3
+        while remaining > buf_len:
+            self.spi.write(buf)
+            remaining -= buf_len
+        self.spi.write(mv[:remaining])
         
         self.cs.value(1)
         
@@ -195,46 +234,60 @@ class ILI9488:
         y0 = max(0, min(self.height - 1, y0))
         y1 = max(0, min(self.height - 1, y1))
         
-        # Column address set
-        self._write_cmd(_CASET)
-        self._write_data(bytearray([x0 >> 8, x0 & 0xFF, x1 >> 8, x1 & 0xFF]))
-        
-        # Row address set
-        self._write_cmd(_PASET)
-        self._write_data(bytearray([y0 >> 8, y0 & 0xFF, y1 >> 8, y1 & 0xFF]))
-        
-        # Memory write
-        self._write_cmd(_RAMWR)
+        # Column address, row address and memory write share one CS-low
+        # transaction; CS is left low with DC high so the caller can stream
+        # pixel data straight after and must raise CS when done.
+        spi = self.spi
+        dc = self.dc
+        cmd = self._cmd_buf
+        win = self._win_buf
+        self.cs.value(0)
+        dc.value(0)
+        cmd[0] = _CASET
+        spi.write(cmd)
+        dc.value(1)
+        win[0] = x0 >> 8
+        win[1] = x0 & 0xFF
+        win[2] = x1 >> 8
+        win[3] = x1 & 0xFF
+        spi.write(win)
+        dc.value(0)
+        cmd[0] = _PASET
+        spi.write(cmd)
+        dc.value(1)
+        win[0] = y0 >> 8
+        win[1] = y0 & 0xFF
+        win[2] = y1 >> 8
+        win[3] = y1 & 0xFF
+        spi.write(win)
+        dc.value(0)
+        cmd[0] = _RAMWR
+        spi.write(cmd)
+        dc.value(1)
         
     def pixel(self, x, y, color):
         """Draw a pixel at the specified position"""
         if 0 <= x < self.width and 0 <= y < self.height:
             self._set_window(x, y, x, y)
-            color_bytes = bytearray([color >> 8, color & 0xFF])
-            self._write_data(color_bytes)
+            self.spi.write(_rgb666(color))
+            self.cs.value(1)
             
-    def text(self, text, x, y, color):
-        """Draw text at the specified position"""
+    def text(self, text, x, y, color, bg_color=None):
+        """Draw text at the specified position, one blitted glyph per character"""
         for char in text:
             if 0 <= x < self.width - 8 and 0 <= y < self.height - 8:
-                for row in range(8):
-                    for col in range(8):
-                        if font8x8[ord(char)][row] & (1 << (7-col)):
-                            self.pixel(x + col, y + row, color)
-            x += 8 
-        
-    def _write_cmd(self, cmd):
-        """Write command"""
-        self.cs.value(0)
-        self.dc.value(0)
-        self.spi.write(bytearray([cmd]))
-        self.cs.value(1)
+                self.draw_char(char, x, y, color, bg_color)
+            x += 8
         
-    def _write_data(self, data):
-        """Write data"""
+    def _write(self, cmd, data=None):
+        """Write a command and its optional parameters in one CS-low transaction"""
         self.cs.value(0)
-        self.dc.value(1)
-        self.spi.write(data)
+        self.dc.value(0)
+        self._cmd_buf[0] = cmd
+        self.spi.write(self._cmd_buf)
+        if data is not None:
+            self.dc.value(1)
+            self.spi.write(data)
         self.cs.value(1)
         
     def draw_char(self, char, x, y, color, bg_color=None, scale=1):
@@ -243,67 +296,27 @@ class ILI9488:
         if char_code not in font8x8:  # Check if character is in our font
             return
             
-        # Get the character pattern from font8x8
-        char_pattern = font8x8[char_code]
-        
         # Calculate dimensions
         width = 8 * scale
         height = 8 * scale
         
         # Convert colors to 18-bit format
-        if isinstance(color, list):
-            color_bytes = bytearray(color)
-        else:
-            # Convert 16-bit color to 18-bit
-            r = ((color >> 11) & 0x1F) << 1
-            g = ((color >> 5) & 0x3F)
-            b = (color & 0x1F) << 1
-            color_bytes = bytearray([r, g, b])
-            
+        color_bytes = _rgb666(color)
         if bg_color is not None:
-            if isinstance(bg_color, list):
-                bg_bytes = bytearray(bg_color)
-            else:
-                r = ((bg_color >> 11) & 0x1F) << 1
-                g = ((bg_color >> 5) & 0x3F)
-                b = (bg_color & 0x1F) << 1
-                bg_bytes = bytearray([r, g, b])
+            bg_bytes = _rgb666(bg_color)
         else:
-            bg_bytes = bytearray([0, 0, 0])  # Black background
-        
-        # Set drawing window
-        self._write_cmd(0x2A)  # Column address set
-        self._write_data(bytearray([x >> 8, x & 0xFF, (x + width - 1) >> 8, (x + width - 1) & 0xFF]))
-        
-        self._write_cmd(0x2B)  # Row address set
-        self._write_data(bytearray([y >> 8, y & 0xFF, (y + height - 1) >> 8, (y + height - 1) & 0xFF]))
-        
-        self._write_cmd(0x2C)  # Memory write
-        
-        # Create buffer for one row of scaled pixels
-        buffer = bytearray(width * 3)  # 3 bytes per pixel
-        
-        # Draw character pixel by pixel with scaling
-        self.cs.value(0)
-        self.dc.value(1)
-        
-        for row in range(8):
-            pattern = char_pattern[row]
-            
-            # Fill buffer for one row
-            for col in range(8):
-                pixel_on = pattern & (1 << (7-col))
-                pixel_bytes = color_bytes if pixel_on else bg_bytes
-                
-                # Scale horizontally by duplicating pixels
-                for sx in range(scale):
-                    idx = (col * scale + sx) * 3
-                    buffer[idx:idx+3] = pixel_bytes
-            
-            # Repeat the row scale times
-            for sy in range(scale):
-                self.spi.write(buffer)
-        
+            bg_bytes = b'\x00\x00\x00'  # Black background
+        
+        # Look up the rendered glyph, building it on first use
+        key = (char_code, color_bytes, bg_bytes, scale)
+        glyph = _glyph_cache.get(key)
+        if glyph is None:
+            glyph = _render_glyph(font8x8[char_code], color_bytes, bg_bytes, scale)
+            _cache_glyph(key, glyph)
+        
+        # Set drawing window, leaving CS low for the pixel data
+        self._set_window(x, y, x + width - 1, y + height - 1)
+        self.spi.write(glyph)
         self.cs.value(1)
         
     def draw_text(self, x, y, text, color, bg_color=None, scale=1):
@@ -399,13 +412,6 @@ class ILI9488:
         y = 0
         err = 0
         
-        # Convert color to RGB666 format if it's RGB565
-        if not isinstance(color, list):
-            r = ((color >> 11) & 0x1F) << 1
-            g = ((color >> 5) & 0x3F)
-            b = (color & 0x1F) << 1
-            color = [r, g, b]
-            
         while x >= y:
             self.fill_rect(x0 - x, y0 + y, 2*x + 1, 1, color)
             self.fill_rect(x0 - x, y0 - y, 2*x + 1, 1, color)
@@ -1,4 +1,4 @@
-from app_volume_serial import AppVolumeController, log_to_file
+from app_volume_serial import AppVolumeController, log_to_file, log_flush
 import time
 import rp2
 
@@ -10,27 +10,37 @@ def main():
     debounce_time = 50  # 50ms debounce
     last_change = time.ticks_ms()
     
+    # Local aliases skip the module attribute lookups in the poll loop
+    bootsel_button = rp2.bootsel_button
+    ticks_ms = time.ticks_ms
+    ticks_diff = time.ticks_diff
+    sleep_ms = time.sleep_ms
+    
     while True:
-        current_state = rp2.bootsel_button()
-        current_time = time.ticks_ms()
+        current_state = bootsel_button()
+        current_time = ticks_ms()
         
         # Only process state changes after debounce period
-        if current_state != last_state and time.ticks_diff(current_time, last_change) > debounce_time:
+        if current_state != last_state and ticks_diff(current_time, last_change) > debounce_time:
             if current_state:  # Button pressed
                 log_to_file("BOOTSEL pressed - Starting volume control")
                 break
             last_state = current_state
             last_change = current_time
             
-        time.sleep_ms(10)
+        # BOOTSEL has no IRQ on RP2040; 50ms polling is still instant to a human
+        sleep_ms(50)
     
     # Initialize volume control after BOOTSEL press
     controller = AppVolumeController()
     log_to_file("Volume control started - CDC interface active")
     
-    while True:
-        controller.update()
-        time.sleep(0.01)
+    try:
+        while True:
+            controller.update()
+            time.sleep(0.01)
+    finally:
+        log_flush()
 
 if __name__ == "__main__":
     main() 
@@ -0,0 +1,27 @@
+# MicroPython firmware manifest for the volume control panel.
+#
+# Freezes the library modules as bytecode so they run from flash instead of
+# being parsed and compiled into RAM on every boot. main.py and boot.py stay
+# on the filesystem so they can still be edited without reflashing.
+#
+# Build (from a micropython checkout):
+#   make -C ports/rp2 BOARD=RPI_PICO FROZEN_MANIFEST=/path/to/pico/manifest.py
+
+include("$(PORT_DIR)/boards/manifest.py")
+
+# USB device stack used by the HID and CDC interfaces
+require("usb-device-hid")
+require("usb-device-cdc")
+
+freeze(
+    ".",
+    (
+        "volume_control_hid.py",
+        "app_volume_serial.py",
+        "ili9488.py",
+        "ft6236.py",
+        "font8x8.py",
+        "rotary.py",
+    ),
+    opt=3,
+)
@@ -2,8 +2,7 @@
 import machine
 import os
 
-# Try to mount the filesystem
-try:
+# Only mount the filesystem if it isn't already mounted. statvfs doesn't raise
+# when nothing is mounted at "/"; it reports zero blocks instead.
+if os.statvfs("/")[2] == 0:
     os.mount(machine.Flash(), "/")
-except:
-    print("Filesystem already mounted")
\ No newline at end of file
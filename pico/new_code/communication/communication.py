@@ -2,6 +2,7 @@ import json
 import time
 import sys
 import select
+import binascii
 from core.logger import get_logger
 from core.config import (
     SERIAL_BUFFER_SIZE, SERIAL_TIMEOUT_MS, RECONNECT_DELAY_MS,
@@ -82,8 +83,9 @@ class CommunicationManager:
                 # Read one byte at a time
                 line = bytearray()
                 while True:
-                    if not self.poll.poll(0):
-                        time.sleep_ms(1)
+                    # Block in poll until the next byte arrives rather than
+                    # spinning on a 1 ms sleep between empty polls
+                    if not self.poll.poll(SERIAL_TIMEOUT_MS):
                         continue
                         
                     byte = sys.stdin.read(1)
@@ -115,7 +117,6 @@ class CommunicationManager:
                         
                         # Handle base64 encoded icon data
                         if data.get("type") == "icon_data_b64":
-                            import binascii
                             app_name = data.get("app")
                             b64_data = data.get("data")
                             
@@ -233,8 +234,8 @@ class CommunicationManager:
                 }
                 if self.send_message(response):
                     self.logger.info("Test response sent successfully")
-                    # After successful handshake, request initial config
-                    time.sleep_ms(100)  # Small delay before requesting config
+                    # After successful handshake, request initial config. The PC
+                    # reads newline-delimited lines, so no gap is needed here.
                     config_request = {
                         "type": "request_initial_config"
                     }
@@ -362,7 +363,6 @@ class CommunicationManager:
                                 break
 
             elif msg_type == "icon_data_b64":
-                import binascii
                 app_name = data.get("app")
                 b64_data = data.get("data")
                 
@@ -1,8 +1,45 @@
 import usb.device
 from usb.device.hid import HIDInterface
 import time
+import micropython
+from machine import Timer
+from micropython import const
 from core.logger import get_logger
 
+_POLL_INTERVAL_MS = const(1)  # Host poll interval for the interrupt IN endpoint
+_RELEASE_RETRY_MS = const(5)  # Retry delay when the release can't be scheduled
+_HID_OPEN_TIMEOUT_MS = const(10000)  # Max wait for the host to open the HID interface
+
+# HID Report descriptor for media and volume controls. A bytes literal is a
+# compile-time constant, so frozen builds keep it in flash rather than RAM.
+_REPORT_DESCRIPTOR = (
+    b"\x05\x0C"        # Usage Page (Consumer)
+    b"\x09\x01"        # Usage (Consumer Control)
+    b"\xA1\x01"        # Collection (Application)
+
+    # Media and volume controls
+    b"\x15\x00"        # Logical Minimum (0)
+    b"\x25\x01"        # Logical Maximum (1)
+    b"\x75\x01"        # Report Size (1)
+    b"\x95\x06"        # Report Count (6) - 6 controls
+
+    # Individual button usages
+    b"\x09\xE2"        # Usage (Mute)           - bit 0
+    b"\x09\xE9"        # Usage (Volume Up)      - bit 1
+    b"\x09\xEA"        # Usage (Volume Down)    - bit 2
+    b"\x09\xCD"        # Usage (Play/Pause)     - bit 3
+    b"\x09\xB5"        # Usage (Next Track)     - bit 4
+    b"\x09\xB6"        # Usage (Previous Track) - bit 5
+    b"\x81\x02"        # Input (Data, Variable, Absolute)
+
+    # Padding
+    b"\x75\x02"        # Report Size (2)
+    b"\x95\x01"        # Report Count (1)
+    b"\x81\x03"        # Input (Constant)
+
+    b"\xC0"            # End Collection
+)
+
 class MediaControlHID:
     """Singleton class to manage HID media controls"""
     _instance = None
@@ -20,6 +57,14 @@ class MediaControlHID:
         self.logger = get_logger()
         self.hid = None
         self.initialized = False
+        # Key release is deferred to a one-shot timer so callers don't block
+        self._release_timer = Timer()
+        self._release_cb = self._release_timer_cb
+        self._release_ref = self._release
+        self._release_pending = False
+        # Bumped on every press so a release scheduled for an earlier press
+        # can't cut a newer one short
+        self._press_gen = 0
     
     def initialize(self):
         """Initialize HID device"""
@@ -32,13 +77,14 @@ class MediaControlHID:
             usb_dev = usb.device.get()
             usb_dev.init(self.hid, builtin_driver=True)
             
-            # Wait for device to be opened by host
-            timeout = 100  # 10 seconds timeout
-            while not self.hid.is_open() and timeout > 0:
-                time.sleep_ms(100)
-                timeout -= 1
+            # Wait for device to be opened by host, checking every 1 ms
+            deadline = time.ticks_add(time.ticks_ms(), _HID_OPEN_TIMEOUT_MS)
+            while not self.hid.is_open():
+                if time.ticks_diff(deadline, time.ticks_ms()) <= 0:
+                    break
+                time.sleep_ms(1)
             
-            if timeout <= 0:
+            if not self.hid.is_open():
                 self.logger.error("Timeout waiting for HID device to be opened")
                 return False
                 
@@ -56,70 +102,83 @@ class MediaControlHID:
             return False
             
         try:
+            if self._release_pending:
+                # Release the previous press first; a second press report with
+                # no release in between reads as one held key to the host,
+                # merging fast volume steps
+                self._release_timer.deinit()
+                self._release(self._press_gen)
             self.hid.send_control(control)
-            time.sleep_ms(duration_ms)
-            self.hid.send_control()  # Release
+            self._press_gen = (self._press_gen + 1) & 0xFFFF
+            self._release_pending = True
+            # Release after duration_ms without blocking the caller
+            self._release_timer.init(mode=Timer.ONE_SHOT, period=duration_ms,
+                                     callback=self._release_cb)
             return True
         except Exception as e:
             self.logger.error(f"Error sending media control: {str(e)}")
             return False
     
+    def _release_timer_cb(self, timer):
+        """Timer callback - defer the release report out of IRQ context"""
+        try:
+            micropython.schedule(self._release_ref, self._press_gen)
+        except RuntimeError:
+            # Schedule queue full; retry shortly instead of leaving the key held
+            timer.init(mode=Timer.ONE_SHOT, period=_RELEASE_RETRY_MS,
+                       callback=self._release_cb)
+
+    def _release(self, gen):
+        """Send the key release report for press generation gen"""
+        if gen != self._press_gen or not self._release_pending:
+            return  # Stale, or already released
+        self._release_pending = False
+        try:
+            self.hid.send_control()
+        except Exception as e:
+            self.logger.error(f"Error releasing media control: {str(e)}")
+
     def is_ready(self):
         """Check if HID device is initialized and ready"""
         return self.initialized and self.hid and self.hid.is_open()
 
 class MediaHIDInterface(HIDInterface):
     # Control bit masks
-    MUTE =        0b00000001  # Bit 0
-    VOL_UP =      0b00000010  # Bit 1
-    VOL_DOWN =    0b00000100  # Bit 2
-    PLAY_PAUSE =  0b00001000  # Bit 3
-    NEXT_TRACK =  0b00010000  # Bit 4
-    PREV_TRACK =  0b00100000  # Bit 5
+    MUTE =        const(0b00000001)  # Bit 0
+    VOL_UP =      const(0b00000010)  # Bit 1
+    VOL_DOWN =    const(0b00000100)  # Bit 2
+    PLAY_PAUSE =  const(0b00001000)  # Bit 3
+    NEXT_TRACK =  const(0b00010000)  # Bit 4
+    PREV_TRACK =  const(0b00100000)  # Bit 5
 
     def __init__(self):
         """Initialize custom HID device"""
         self.logger = get_logger()
         self.logger.info("MediaHIDInterface: Creating new instance")
         super().__init__(
-            report_descriptor=self.REPORT_DESCRIPTOR,
+            report_descriptor=_REPORT_DESCRIPTOR,
             interface_str="MicroPython Media Control",
         )
         self._last_state = 0
         self.logger.info("MediaHIDInterface: Instance created successfully")
 
+    def desc_cfg(self, desc, itf_num, ep_num, strs):
+        """Build config descriptor, overriding the interrupt IN bInterval"""
+        super().desc_cfg(desc, itf_num, ep_num, strs)
+        # The interrupt IN endpoint is the last descriptor written and
+        # bInterval is its final byte. First pass only sizes (desc.b is None).
+        if desc.b:
+            desc.b[desc.o - 1] = _POLL_INTERVAL_MS
+
+    # One prebuilt report per 6-bit control state, so sending never allocates
+    _REPORTS = tuple(bytes((state,)) for state in range(0x40))
+
     def send_control(self, control=None):
         """Send media control command"""
         if control is None:
-            self.send_report(b"\x00")
+            self.send_report(self._REPORTS[0])
         else:
-            self.send_report(bytes([control & 0x3F]))  # Use bottom 6 bits
+            self.send_report(self._REPORTS[control & 0x3F])  # Use bottom 6 bits
             
-    # HID Report descriptor for media and volume controls
-    REPORT_DESCRIPTOR = bytes([
-        0x05, 0x0C,        # Usage Page (Consumer)
-        0x09, 0x01,        # Usage (Consumer Control)
-        0xA1, 0x01,        # Collection (Application)
-        
-        # Media and volume controls
-        0x15, 0x00,        # Logical Minimum (0)
-        0x25, 0x01,        # Logical Maximum (1)
-        0x75, 0x01,        # Report Size (1)
-        0x95, 0x06,        # Report Count (6) - 6 controls
-        
-        # Individual button usages
-        0x09, 0xE2,        # Usage (Mute)           - bit 0
-        0x09, 0xE9,        # Usage (Volume Up)      - bit 1
-        0x09, 0xEA,        # Usage (Volume Down)    - bit 2
-        0x09, 0xCD,        # Usage (Play/Pause)     - bit 3
-        0x09, 0xB5,        # Usage (Next Track)     - bit 4
-        0x09, 0xB6,        # Usage (Previous Track) - bit 5
-        0x81, 0x02,        # Input (Data, Variable, Absolute)
-        
-        # Padding
-        0x75, 0x02,        # Report Size (2)
-        0x95, 0x01,        # Report Count (1)
-        0x81, 0x03,        # Input (Constant)
-        
-        0xC0               # End Collection
-    ]) 
\ No newline at end of file
+    # Kept as a class attribute for existing callers
+    REPORT_DESCRIPTOR = _REPORT_DESCRIPTOR
@@ -1,5 +1,7 @@
 from machine import Pin, I2C
 import time
+import struct
+import micropython
 from core.logger import get_logger
 from core.config import TOUCH_I2C_FREQ, TOUCH_DEBOUNCE_MS
 
@@ -27,6 +29,9 @@ class FT6236:
         self.last_touch_time = 0
         self.DEBOUNCE_MS = TOUCH_DEBOUNCE_MS
         self.continuous_touch = False
+        # TD_STATUS..P1_YL burst read buffer (5 consecutive registers)
+        self._touch_buf = bytearray(REG_P1_YL - REG_TD_STATUS + 1)
+        self._reg_buf = bytearray(1)
         self.initialized = False
         
         # Initialize the device
@@ -45,28 +50,31 @@ class FT6236:
     
     def _read_reg(self, reg, length=1):
         """Read register(s)"""
-        self.i2c.writeto(self.address, bytes([reg]))
-        return self.i2c.readfrom(self.address, length)
+        if length == 1:
+            # Reuse the single-byte scratch buffer; caller reads it immediately
+            self.i2c.readfrom_mem_into(self.address, reg, self._reg_buf)
+            return self._reg_buf
+        return self.i2c.readfrom_mem(self.address, reg, length)
     
+    @micropython.native
     def read_touch(self):
         """Read touch data. Returns tuple (touched, x, y) or None if error"""
         if not self.initialized:
             return False, 0, 0
             
         try:
-            # Read touch status
-            status = self._read_reg(REG_TD_STATUS)[0]
+            # Read touch status and first point in a single burst transaction
+            buf = self._touch_buf
+            self.i2c.readfrom_mem_into(self.address, REG_TD_STATUS, buf)
+            status = buf[0]
             current_time = time.ticks_ms()
             
             # If screen is touched
             if status:
-                # Read coordinates regardless of state for continuous tracking
-                x_h = self._read_reg(REG_P1_XH)[0]
-                x_l = self._read_reg(REG_P1_XL)[0]
-                y_h = self._read_reg(REG_P1_YH)[0]
-                y_l = self._read_reg(REG_P1_YL)[0]
-                x = ((x_h & 0x0F) << 8) | x_l
-                y = ((y_h & 0x0F) << 8) | y_l
+                # Decode coordinates regardless of state for continuous tracking
+                x, y = struct.unpack_from(">HH", buf, 1)
+                x &= 0x0FFF
+                y &= 0x0FFF
                 
                 # If this is a new touch or we're in continuous mode
                 if (not self.last_touch_state and 
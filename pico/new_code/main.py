@@ -33,41 +33,48 @@ def wait_for_bootsel():
     debounce_time = 50  # 50ms debounce
     last_change = time.ticks_ms()
     
+    # Local aliases skip the module attribute lookups in the poll loop
+    bootsel_button = rp2.bootsel_button
+    ticks_ms = time.ticks_ms
+    ticks_diff = time.ticks_diff
+    sleep_ms = time.sleep_ms
+    
     try:
         while True:
-            current_state = rp2.bootsel_button()
-            current_time = time.ticks_ms()
+            current_state = bootsel_button()
+            current_time = ticks_ms()
             
             # Only process state changes after debounce period
-            if current_state != last_state and time.ticks_diff(current_time, last_change) > debounce_time:
+            if current_state != last_state and ticks_diff(current_time, last_change) > debounce_time:
                 if current_state:  # Button pressed
                     logger.info("BOOTSEL pressed - Starting volume control")
                     return True
                 last_state = current_state
                 last_change = current_time
                 
-            time.sleep_ms(10)
+            # BOOTSEL has no IRQ on RP2040; 50ms polling is still instant to a human
+            sleep_ms(50)
     except KeyboardInterrupt:
         logger.info("Interrupted during BOOTSEL wait")
         return False
 
+# Touch action -> (HID control bit, name for logging)
+MEDIA_ACTIONS = {
+    'play': (MediaHIDInterface.PLAY_PAUSE, "PLAY_PAUSE"),
+    'prev': (MediaHIDInterface.PREV_TRACK, "PREV_TRACK"),
+    'next': (MediaHIDInterface.NEXT_TRACK, "NEXT_TRACK"),
+    'mute': (MediaHIDInterface.MUTE, "MUTE"),
+}
+
 def handle_media_control(action):
     """Handle media control actions"""
     logger.info(f"Media control action: {action}")
-    if comm_manager and comm_manager.media_control:
+    media_action = MEDIA_ACTIONS.get(action)
+    if media_action and comm_manager and comm_manager.media_control:
+        control, name = media_action
         try:
-            if action == 'play':
-                success = comm_manager.media_control.send_media_control(MediaHIDInterface.PLAY_PAUSE)
-                logger.info(f"PLAY_PAUSE command {'sent' if success else 'failed'}")
-            elif action == 'prev':
-                success = comm_manager.media_control.send_media_control(MediaHIDInterface.PREV_TRACK)
-                logger.info(f"PREV_TRACK command {'sent' if success else 'failed'}")
-            elif action == 'next':
-                success = comm_manager.media_control.send_media_control(MediaHIDInterface.NEXT_TRACK)
-                logger.info(f"NEXT_TRACK command {'sent' if success else 'failed'}")
-            elif action == 'mute':
-                success = comm_manager.media_control.send_media_control(MediaHIDInterface.MUTE)
-                logger.info(f"MUTE command {'sent' if success else 'failed'}")
+            success = comm_manager.media_control.send_media_control(control)
+            logger.info(f"{name} command {'sent' if success else 'failed'}")
             return success
         except Exception as e:
             logger.error(f"Error in media control: {str(e)}")
@@ -75,7 +82,7 @@ def handle_media_control(action):
 
 def handle_touch(action, app_name=None):
     """Handle touch events"""
-    if action in ['play', 'prev', 'next', 'mute']:
+    if action in MEDIA_ACTIONS:
         handle_media_control(action)
     elif action == 'app_selected' and app_name:
         logger.info(f"App selected: {app_name}")
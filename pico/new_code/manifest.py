@@ -0,0 +1,18 @@
+# MicroPython firmware manifest for the new_code application.
+#
+# Freezes the core/drivers/communication/ui packages as bytecode so they run
+# from flash, and constants such as the HID report descriptor and font table
+# stay out of RAM. main.py and boot.py stay on the filesystem.
+#
+# Build (from a micropython checkout):
+#   make -C ports/rp2 BOARD=RPI_PICO FROZEN_MANIFEST=/path/to/pico/new_code/manifest.py
+
+include("$(PORT_DIR)/boards/manifest.py")
+
+# USB device stack used by the media control HID interface
+require("usb-device-hid")
+
+package("core", opt=3)
+package("drivers", opt=3)
+package("communication", opt=3)
+package("ui", opt=3)
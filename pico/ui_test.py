@@ -2,8 +2,11 @@ from machine import Pin, SPI, I2C, PWM
 from ili9488 import ILI9488
 from ft6236 import FT6236
 from rotary import RotaryEncoder
+from micropython import const
 import time
 
+_DEBUG = const(0)  # Set to 1 to print touch/draw trace messages
+
 # Constants and color definitions
 SCREEN_WIDTH = 480
 SCREEN_HEIGHT = 320
@@ -142,7 +145,8 @@ def draw_app_list(selected_index=0):
             display.fill_circle(dot_x + dot_radius, dot_y, dot_radius, DARK_GRAY)
 
 def draw_right_panel(app_name, volume=75):
-    print(f"Drawing right panel for app: {app_name}")
+    if _DEBUG:
+        print(f"Drawing right panel for app: {app_name}")
     
     # Define panel sections
     info_panel_width = RIGHT_PANEL_WIDTH - 100  # Main info area
@@ -156,10 +160,12 @@ def draw_right_panel(app_name, volume=75):
     display.draw_vline(button_panel_x, 0, SCREEN_HEIGHT, WHITE)
     
     # Draw app info in main area
-    print("Drawing app name")
+    if _DEBUG:
+        print("Drawing app name")
     display.draw_text(LEFT_PANEL_WIDTH+20, 20, app_name, WHITE, None, scale=3)
     
-    print("Drawing volume")
+    if _DEBUG:
+        print("Drawing volume")
     display.draw_text(LEFT_PANEL_WIDTH+20, 100, str(volume), WHITE, None, scale=4)
     
     # Draw media controls
@@ -249,12 +255,14 @@ def handle_touch():
             
         last_x = x
         last_y = y
-        print(f"\nTouch detected at x: {x}, y: {y}")
+        if _DEBUG:
+            print(f"\nTouch detected at x: {x}, y: {y}")
         
         # Handle Switch Device button press
         button_height = 30
         if x < LEFT_PANEL_WIDTH and y < button_height + 10:  # +10 for padding
-            print("SWITCH DEVICE PRESSED")
+            if _DEBUG:
+                print("SWITCH DEVICE PRESSED")
             # Highlight button when pressed
             display.draw_button(5, 5, LEFT_PANEL_WIDTH - 10, button_height, "Switch Device", BLACK, GRAY)
             time.sleep_ms(100)  # Visual feedback
@@ -274,17 +282,20 @@ def handle_touch():
             button_index = button_x // button_width
             
             if button_index == 0:
-                print("PREVIOUS TRACK")
+                if _DEBUG:
+                    print("PREVIOUS TRACK")
                 draw_media_controls('prev')
                 time.sleep_ms(50)
                 draw_media_controls()
             elif button_index == 1:
-                print("PLAY/PAUSE")
+                if _DEBUG:
+                    print("PLAY/PAUSE")
                 draw_media_controls('play')
                 time.sleep_ms(50)
                 draw_media_controls()
             elif button_index == 2:
-                print("NEXT TRACK")
+                if _DEBUG:
+                    print("NEXT TRACK")
                 draw_media_controls('next')
                 time.sleep_ms(50)
                 draw_media_controls()
@@ -295,13 +306,15 @@ def handle_touch():
             
             # Mute button (top half)
             if 5 <= y <= button_height:
-                print("MUTE BUTTON PRESSED")
+                if _DEBUG:
+                    print("MUTE BUTTON PRESSED")
                 draw_buttons('mute')  # Highlight mute button
                 time.sleep_ms(50)  # Reduced delay
                 draw_buttons()  # Return to normal
             # Mic button (bottom half)
             elif button_height + 10 <= y <= SCREEN_HEIGHT - 5:
-                print("MIC BUTTON PRESSED")
+                if _DEBUG:
+                    print("MIC BUTTON PRESSED")
                 draw_buttons('mic')  # Highlight mic button
                 time.sleep_ms(50)  # Reduced delay
                 draw_buttons()  # Return to normal
@@ -311,7 +324,8 @@ def handle_touch():
             if not is_dragging:
                 is_dragging = True
                 drag_start_x = x
-                print("Started dragging in left panel")
+                if _DEBUG:
+                    print("Started dragging in left panel")
             else:
                 # Calculate drag distance
                 drag_distance = x - drag_start_x
@@ -323,12 +337,14 @@ def handle_touch():
                     
                     if drag_distance > 0 and current_page > 0:  # Swipe right
                         current_page -= 1
-                        print(f"Page changed to {current_page + 1}")
+                        if _DEBUG:
+                            print(f"Page changed to {current_page + 1}")
                         draw_app_list(selected_app)
                         is_dragging = False
                     elif drag_distance < 0 and current_page < total_pages - 1:  # Swipe left
                         current_page += 1
-                        print(f"Page changed to {current_page + 1}")
+                        if _DEBUG:
+                            print(f"Page changed to {current_page + 1}")
                         draw_app_list(selected_app)
                         is_dragging = False
     